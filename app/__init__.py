@@ -1,27 +1,148 @@
-from flask import Flask
-from flask_cors import CORS
+from flask import Flask, jsonify, current_app
 import os
+import logging
+
+from app.utils.async_runner import async_to_sync
+from app.utils.json_provider import dumps_static
+
+class CrawlerFlask(Flask):
+    """Flask app that runs async views on the shared background event loop"""
+    
+    def async_to_sync(self, func):
+        return async_to_sync(func)
+
+def simple_health():
+    return jsonify({
+        'status': 'healthy',
+        'service': 'Web Crawler API',
+        'version': '1.0.0',
+        'message': 'Fallback health endpoint'
+    })
+
+def api_health():
+    return jsonify({
+        'status': 'healthy',
+        'service': 'Web Crawler API',
+        'version': '1.0.0',
+        'note': 'Running in fallback mode due to import errors'
+    })
+
+def simple_crawl():
+    return jsonify({
+        'success': False,
+        'error': 'Crawler service not available due to import errors',
+        'message': 'Please check your dependencies and configuration'
+    }), 503
+
+# Main route of each API module, answered with a 503 when that module could not be imported
+_FALLBACK_ROUTES = (
+    ('crawl', '/api/v1/crawl'),
+    ('content_only', '/api/v1/content'),
+    ('enhanced_content', '/api/v1/content/selective'),
+    ('array_content', '/api/v1/content/array'),
+)
+
+def register_fallback_routes(app, failed=None):
+    """Add /health and 503 endpoints for API modules that failed to import (all of them by default)"""
+    app.add_url_rule('/health', view_func=simple_health)
+    if failed is None or 'health' in failed:
+        app.add_url_rule('/api/v1/health', view_func=api_health)
+    for module, rule in _FALLBACK_ROUTES:
+        if failed is None or module in failed:
+            app.add_url_rule(rule, view_func=simple_crawl, methods=['POST'])
+
+# Rate limit exceeded payload is static, so it is serialized once at import
+_RATE_LIMIT_EXCEEDED_BODY = dumps_static({
+    'success': False,
+    'error': 'Rate limit exceeded',
+    'message': 'Too many requests. Please try again later or use an API key for unlimited access.',
+    'details': {
+        'retry_after_seconds': 60,
+        'api_key_header': 'X-API-Key',
+        'documentation': '/api/v1/docs'
+    }
+}) + b"\n"
+
+def rate_limit_exceeded(e):
+    """Custom handler for rate limit exceeded"""
+    return current_app.response_class(_RATE_LIMIT_EXCEEDED_BODY, 429, mimetype='application/json')
+
+# Crawler truncation uses its own key: Flask reads MAX_CONTENT_LENGTH as the request body cap
+_CRAWLER_INT_SETTINGS = ('CRAWLER_TIMEOUT', 'MAX_BATCH_SIZE', 'CRAWLER_MAX_CONTENT_LENGTH')
 
 def create_app(config_name=None):
     """Application factory pattern"""
-    app = Flask(__name__)
+    app = CrawlerFlask(__name__)
+    
+    # Serialize every jsonify/success_response payload with orjson when available
+    from app.utils.json_provider import ORJSONProvider
+    app.json = ORJSONProvider(app)
+    
+    env = os.environ
+    
+    # Optional comma-separated subset of API modules to load (defaults to all)
+    api_modules = env.get('API_V1_MODULES', '')
     
-    # Basic configuration
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
-    app.config['DEBUG'] = True if config_name == 'development' else False
+    app.config.update({
+        # Basic configuration
+        'SECRET_KEY': env.get('SECRET_KEY', 'dev-secret-key'),
+        'DEBUG': config_name == 'development',
+        
+        'ALLOWED_ORIGINS': ['*'],  # Allow all origins for development
+        'ENABLE_CORS': env.get('ENABLE_CORS', 'true').lower() != 'false',
+        'HTML_PARSER': env.get('HTML_PARSER', 'html.parser'),
+        'MAX_CONTENT_LENGTH': 1 << 20,  # Request body cap in bytes, enforced by Werkzeug while reading
+        
+        # Rate limit counters; point this at redis:// so all gunicorn workers share them
+        'RATELIMIT_STORAGE_URI': env.get('RATELIMIT_STORAGE_URI', 'memory://'),
+        'RATELIMIT_STRATEGY': env.get('RATELIMIT_STRATEGY', 'moving-window'),
+        'API_V1_MODULES': [m.strip() for m in api_modules.split(',') if m.strip()] or None
+    })
     
-    # Setup CORS
-    CORS(app)
+    # Crawler settings are only applied when set, so each service keeps its own default otherwise
+    for key in _CRAWLER_INT_SETTINGS:
+        if key in env:
+            app.config[key] = int(env[key])
     
-    # Import and register blueprints
+    # Rate limits declared on API views are enforced through the shared limiter; the JSON
+    # 429 handler is registered on the app so it applies whichever API modules are loaded
+    from app.extensions import limiter, IS_DEVELOPMENT
+    app.config['RATELIMIT_ENABLED'] = not IS_DEVELOPMENT  # Disable in development
+    limiter.init_app(app)
+    app.register_error_handler(429, rate_limit_exceeded)
+    
+    # Setup CORS (flask_cors is only imported when the feature is enabled)
+    if app.config['ENABLE_CORS']:
+        from flask_cors import CORS
+        CORS(app)
+    
+    # Setup basic logging (LOG_LEVEL=WARNING skips per-request INFO logging entirely)
+    logging.basicConfig(level=env.get('LOG_LEVEL', 'INFO').upper())
+    
+    # Try to import and register blueprints
     try:
-        from app.api.v1 import api_v1
+        from app.api.v1 import api_v1, register_routes
+        # Route modules must be imported before the blueprint is registered
+        failed = register_routes(app.config.get('API_V1_MODULES'))
         app.register_blueprint(api_v1, url_prefix='/api/v1')
+        app.logger.info("Successfully registered API v1 blueprint")
+        
+        if failed:
+            app.logger.error(f"Could not import API modules {failed}, serving fallback endpoints")
+            register_fallback_routes(app, failed)
+        
+        # Route dump is only useful when debugging, so skip building it otherwise
+        if app.logger.isEnabledFor(logging.DEBUG):
+            routes = [f"{rule.methods} {rule.rule}" for rule in app.url_map.iter_rules()]
+            app.logger.debug(f"Registered routes: {routes}")
+            
     except ImportError as e:
-        print(f"Warning: Could not import API blueprint: {e}")
-        # Create a simple health endpoint if blueprints fail
-        @app.route('/health')
-        def health():
-            return {'status': 'healthy', 'service': 'Web Crawler API'}
+        app.logger.error(f"Could not import API blueprint: {e}")
+        
+        # Create simple endpoints as fallback
+        register_fallback_routes(app)
+    
+    except Exception as e:
+        app.logger.error(f"Unexpected error during blueprint registration: {e}")
     
-    return app
\ No newline at end of file
+    return app
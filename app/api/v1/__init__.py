@@ -1,5 +1,24 @@
 from flask import Blueprint
+from importlib import import_module
+import logging
+
+logger = logging.getLogger(__name__)
 
 api_v1 = Blueprint('api_v1', __name__)
 
-from . import crawl, health, content_only, enhanced_content, array_content
\ No newline at end of file
+# Route modules attach their views to api_v1 when imported
+ROUTE_MODULES = ('crawl', 'health', 'content_only', 'enhanced_content', 'array_content')
+
+def register_routes(modules=None):
+    """Import route modules on demand so one missing dependency does not disable the others.
+
+    Returns the names of the modules that could not be imported.
+    """
+    failed = []
+    for name in modules or ROUTE_MODULES:
+        try:
+            import_module(f"{__name__}.{name}")
+        except ImportError as e:
+            logger.warning(f"Could not load API module '{name}': {e}")
+            failed.append(name)
+    return failed
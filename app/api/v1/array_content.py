@@ -1,54 +1,90 @@
 # app/api/v1/array_content.py - FIXED VERSION - Order & Image URLs
-from flask import request, jsonify, current_app
+from flask import jsonify, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
 import asyncio
 import time
-import traceback
-import os
-from functools import wraps
 
 from app.api.v1 import api_v1
+from app.extensions import limiter
 from app.services.array_content_service import ArrayBasedCrawlerService
 from app.utils.validators import validate_crawl_request, validate_batch_request
 from app.utils.response_helpers import success_response, error_response
+from app.utils.json_provider import dumps_static
+from app.utils.request_helpers import read_json
 
-# Rate limiting decorator
-def apply_rate_limit(limit_string):
-    """Apply rate limit only in production without valid API key"""
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            if os.getenv('FLASK_ENV', 'production') == 'development':
-                return f(*args, **kwargs)
-            
-            api_key = request.headers.get('X-API-Key')
-            valid_api_key = os.getenv('API_KEY', '')
-            
-            if api_key and api_key == valid_api_key and valid_api_key:
-                return f(*args, **kwargs)
-            
-            return f(*args, **kwargs)
-        
-        return decorated_function
-    return decorator
+@api_v1.record_once
+def init_crawler_service(state):
+    """Create the app's shared ArrayBasedCrawlerService when the blueprint is registered"""
+    state.app.extensions['array_crawler'] = ArrayBasedCrawlerService(state.app.config)
 
-def safe_async_run(coro, timeout=30):
-    """Safely run async coroutine with proper event loop handling"""
-    try:
-        try:
-            loop = asyncio.get_running_loop()
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result(timeout=timeout)
-        except RuntimeError:
-            return asyncio.run(coro)
-    except Exception as e:
-        current_app.logger.error(f"Async execution error: {str(e)}")
-        raise e
+def get_crawler_service():
+    """Return the app's shared ArrayBasedCrawlerService"""
+    return current_app.extensions['array_crawler']
+
+# Item keys produced by the extractor itself rather than by sub-selectors
+_INTERNAL_ITEM_FIELDS = frozenset(('index', 'main_content', 'word_count', 'char_count'))
+
+def _flatten_field(value):
+    """Collapse an extracted field to one value, joining lists of several strings"""
+    if isinstance(value, list):
+        if not value:
+            return ''
+        if len(value) == 1 or not all(isinstance(v, str) for v in value):
+            return value[0]
+        return ' | '.join(value)
+    return value or ''
+
+def _clean_selectors(selectors):
+    """Freeze client-supplied exclude selectors, dropping anything that is not a non-empty string"""
+    if not isinstance(selectors, (list, tuple)):
+        return ()
+    return tuple(selector for selector in selectors if isinstance(selector, str) and selector)
+
+def _extraction_info(sub_selectors, exclude_selectors, items_data, total_time):
+    """Build the extraction_info block of a single-URL array response"""
+    return {
+        'sub_selectors_used': list(sub_selectors.keys()),
+        'exclude_selectors_used': exclude_selectors,
+        'order_preserved': True,  # Top to bottom order maintained
+        'image_urls_absolute': True,  # Image URLs converted to absolute
+        'link_urls_absolute': True,   # Link URLs converted to absolute
+        'deduplication_applied': items_data.get('deduplication_applied', False),
+        'extraction_time': round(total_time, 2)
+    }
+
+def _format_item(item, sub_keys):
+    """Flatten one extracted item, keeping every requested sub-selector key present"""
+    formatted_item = {
+        'index': item.get('index', 0),  # Order preserved: 0 = top item
+        'main_content': item.get('main_content', ''),
+        'word_count': item.get('word_count', 0)
+    }
+    formatted_item.update({
+        key: _flatten_field(value)
+        for key, value in item.items() if key not in _INTERNAL_ITEM_FIELDS
+    })
+    for sub_key in sub_keys:
+        formatted_item.setdefault(sub_key, '')
+    return formatted_item
+
+def _format_batch_item(item, sub_keys):
+    """Batch variant of _format_item: lists keep their first value, other values become strings"""
+    formatted_item = {
+        'index': item.get('index', 0),  # Order preserved
+        'main_content': item.get('main_content', ''),
+        'word_count': item.get('word_count', 0)
+    }
+    formatted_item.update({
+        key: value[0] if isinstance(value, list) else str(value)
+        for key, value in item.items() if value and key not in _INTERNAL_ITEM_FIELDS
+    })
+    for sub_key in sub_keys:
+        formatted_item.setdefault(sub_key, '')
+    return formatted_item
 
 @api_v1.route('/content/array', methods=['POST'])
-@apply_rate_limit("10 per minute")
-def extract_repeated_elements():
+@limiter.limit("10 per minute")
+async def extract_repeated_elements():
     """
     Extract repeated elements with proper ordering (top to bottom) and absolute image URLs
     
@@ -110,10 +146,15 @@ def extract_repeated_elements():
         }
     }
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         # Validate basic request
         is_valid, error_msg = validate_crawl_request(data)
@@ -131,7 +172,7 @@ def extract_repeated_elements():
         # Extract configuration
         sub_selectors = config.get('sub_selectors', {})
         limit = min(config.get('limit', 50), 100)
-        exclude_selectors = config.get('exclude_selectors', [])
+        exclude_selectors = _clean_selectors(config.get('exclude_selectors'))
         
         # Validate sub_selectors
         if sub_selectors and not isinstance(sub_selectors, dict):
@@ -146,74 +187,51 @@ def extract_repeated_elements():
             }
         }
         
-        current_app.logger.info(f"Array extraction request:")
-        current_app.logger.info(f"  URL: {url}")
-        current_app.logger.info(f"  Main selector: {main_selector}")
-        current_app.logger.info(f"  Sub-selectors: {list(sub_selectors.keys())}")
-        current_app.logger.info(f"  Limit: {limit}")
+        current_app.logger.info(
+            "Array extraction request: url=%s selector=%s sub_selectors=%s limit=%s",
+            url, main_selector, sub_selectors.keys(), limit
+        )
         
         # Initialize crawler service
-        crawler_service = ArrayBasedCrawlerService(current_app.config)
+        crawler_service = get_crawler_service()
         
         # Run extraction
         try:
-            result = safe_async_run(
+            result = await asyncio.wait_for(
                 crawler_service.crawl_array_content(
-                    url, array_selectors, exclude_selectors, 'structured'
+                    url, array_selectors, exclude_selectors, 'none'
                 ),
                 timeout=40
             )
         except asyncio.TimeoutError:
             return error_response("Array extraction timeout after 40 seconds", 408)
         except Exception as crawl_error:
-            current_app.logger.error(f"Array extraction failed: {str(crawl_error)}")
-            current_app.logger.error(f"Traceback: {traceback.format_exc()}")
+            current_app.logger.exception("Array extraction failed: %s", crawl_error)
             return error_response(f"Array extraction failed: {str(crawl_error)}", 500)
         
         # Process results
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         if result and result.success:
             # Extract items from the result
             arrays_data = result.metadata.get('arrays', {})
             items_data = arrays_data.get('items', {})
             raw_items = items_data.get('items', [])
+            extraction_info = _extraction_info(sub_selectors, exclude_selectors, items_data, total_time)
             
-            # Format items to have all fields at the same level (preserving order)
-            formatted_items = []
+            # Selector mismatches are common: answer them without formatting or logging
+            if not raw_items:
+                return success_response({
+                    'url': url,
+                    'selector': main_selector,
+                    'total_found': 0,
+                    'items': [],
+                    'extraction_info': extraction_info
+                })
             
-            for item in raw_items:  # Items are already in correct order (top to bottom)
-                # Start with basic fields
-                formatted_item = {
-                    'index': item.get('index', 0),  # Order preserved: 0 = top item
-                    'main_content': item.get('main_content', ''),
-                    'word_count': item.get('word_count', 0)
-                }
-                
-                # Add all sub-selector extracted fields
-                for key, value in item.items():
-                    # Skip internal fields
-                    if key not in ['index', 'main_content', 'word_count', 'char_count']:
-                        # Handle different value types
-                        if isinstance(value, list):
-                            # Join list values or take first non-empty item
-                            if value:
-                                # If it's a list of strings, take the first one
-                                if all(isinstance(v, str) for v in value):
-                                    formatted_item[key] = value[0] if len(value) == 1 else ' | '.join(value)
-                                else:
-                                    formatted_item[key] = value[0]
-                            else:
-                                formatted_item[key] = ''
-                        else:
-                            formatted_item[key] = value or ''
-                
-                # Ensure all requested sub_selectors are present (even if empty)
-                for sub_key in sub_selectors.keys():
-                    if sub_key not in formatted_item:
-                        formatted_item[sub_key] = ''
-                
-                formatted_items.append(formatted_item)
+            # Format items to have all fields at the same level (items are already top to bottom)
+            sub_keys = tuple(sub_selectors)
+            formatted_items = [_format_item(item, sub_keys) for item in raw_items]
             
             # Create clean response
             response_data = {
@@ -221,22 +239,13 @@ def extract_repeated_elements():
                 'selector': main_selector,
                 'total_found': len(formatted_items),
                 'items': formatted_items,  # Items in order: index 0 = top of page
-                'extraction_info': {
-                    'sub_selectors_used': list(sub_selectors.keys()),
-                    'exclude_selectors_used': exclude_selectors,
-                    'order_preserved': True,  # Top to bottom order maintained
-                    'image_urls_absolute': True,  # Image URLs converted to absolute
-                    'link_urls_absolute': True,   # Link URLs converted to absolute
-                    'deduplication_applied': items_data.get('deduplication_applied', False),
-                    'extraction_time': round(total_time, 2)
-                }
+                'extraction_info': extraction_info
             }
             
-            current_app.logger.info(f"Extraction successful:")
-            current_app.logger.info(f"  Total items found: {len(formatted_items)}")
-            current_app.logger.info(f"  Order preserved: top to bottom")
-            current_app.logger.info(f"  Image URLs made absolute: {any('image' in str(k).lower() for k in sub_selectors.keys())}")
-            current_app.logger.info(f"  Fields per item: {list(formatted_items[0].keys()) if formatted_items else []}")
+            current_app.logger.info(
+                "Extraction successful: total=%d fields=%s",
+                len(formatted_items), formatted_items[0].keys()
+            )
             
             return success_response(response_data)
         
@@ -245,13 +254,52 @@ def extract_repeated_elements():
             return error_response(error_msg, 400)
             
     except Exception as e:
-        current_app.logger.error(f"Array extraction endpoint error: {str(e)}")
-        current_app.logger.error(f"Full traceback: {traceback.format_exc()}")
+        current_app.logger.exception("Array extraction endpoint error: %s", e)
         return error_response("Internal server error", 500)
 
+# Auto-detected sub-selectors for the simple endpoint, with proper field names for images and links
+_AUTO_SUB_SELECTORS = {
+    'title': 'h1, h2, h3, h4, .title, .headline, .news-title, .article-title',
+    'content': 'p, .content, .summary, .excerpt, .description, .text',
+    'image': 'img',  # Will extract actual image URL
+    'link': 'a',     # Will extract actual link URL
+    'date': '.date, .time, time, .timestamp, .published',
+    'author': '.author, .by, .writer, .reporter'
+}
+
+_SIMPLE_EXCLUDES = ('.ads', '.advertisement', '.sidebar', '.social-share')
+
+def _format_simple_item(item):
+    """Format one simple-endpoint item; the field set is fixed, so each field is a direct lookup"""
+    main_content = item.get('main_content', '')
+    formatted_item = {
+        'index': item.get('index', 0),  # 0 = top item
+        'title': '',
+        'content': main_content,
+        'image': '',  # Will contain absolute URL
+        'link': '',   # Will contain absolute URL
+        'date': '',
+        'author': '',
+        'word_count': item.get('word_count', 0)
+    }
+    for key in _AUTO_SUB_SELECTORS:
+        value = item.get(key)
+        if not value:
+            continue
+        if isinstance(value, str):
+            # Common case: the extractor already produced a single string
+            formatted_item[key] = value
+        else:
+            formatted_item[key] = value[0] if isinstance(value, list) else str(value)
+    
+    # Use main_content as content if no specific content found
+    if not formatted_item['content'] and main_content:
+        formatted_item['content'] = main_content
+    return formatted_item
+
 @api_v1.route('/content/array/simple', methods=['POST'])
-@apply_rate_limit("15 per minute")
-def extract_simple_repeated_elements():
+@limiter.limit("15 per minute")
+async def extract_simple_repeated_elements():
     """
     Simplified version - automatically detect common fields with proper ordering
     
@@ -264,10 +312,15 @@ def extract_simple_repeated_elements():
     Automatically extracts: title, content, image (with absolute URL), link (with absolute URL), date, author
     Order preserved: index 0 = top item on page
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         is_valid, error_msg = validate_crawl_request(data)
         if not is_valid:
@@ -279,79 +332,38 @@ def extract_simple_repeated_elements():
         if not main_selector:
             return error_response("'selector' field is required", 400)
         
-        # Auto-detect common sub-selectors with proper field names for images and links
-        auto_sub_selectors = {
-            'title': 'h1, h2, h3, h4, .title, .headline, .news-title, .article-title',
-            'content': 'p, .content, .summary, .excerpt, .description, .text',
-            'image': 'img',  # Will extract actual image URL
-            'link': 'a',     # Will extract actual link URL
-            'date': '.date, .time, time, .timestamp, .published',
-            'author': '.author, .by, .writer, .reporter'
-        }
-        
         # Build config
         array_selectors = {
             'items': {
                 'selector': main_selector,
-                'sub_selectors': auto_sub_selectors,
+                'sub_selectors': _AUTO_SUB_SELECTORS,
                 'limit': 20
             }
         }
         
-        exclude_selectors = ['.ads', '.advertisement', '.sidebar', '.social-share']
-        
-        current_app.logger.info(f"Simple array extraction:")
-        current_app.logger.info(f"  URL: {url}")
-        current_app.logger.info(f"  Selector: {main_selector}")
-        current_app.logger.info(f"  Auto sub-selectors: {list(auto_sub_selectors.keys())}")
+        current_app.logger.info("Simple array extraction: url=%s selector=%s", url, main_selector)
         
-        crawler_service = ArrayBasedCrawlerService(current_app.config)
+        crawler_service = get_crawler_service()
         
         try:
-            result = safe_async_run(
+            result = await asyncio.wait_for(
                 crawler_service.crawl_array_content(
-                    url, array_selectors, exclude_selectors, 'structured'
+                    url, array_selectors, _SIMPLE_EXCLUDES, 'none'
                 ),
                 timeout=30
             )
         except Exception as crawl_error:
             return error_response(f"Simple extraction failed: {str(crawl_error)}", 500)
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         if result and result.success:
             arrays_data = result.metadata.get('arrays', {})
             items_data = arrays_data.get('items', {})
             raw_items = items_data.get('items', [])
             
-            # Format items with all fields at same level (order preserved)
-            formatted_items = []
-            
-            for item in raw_items:  # Already in correct order
-                formatted_item = {
-                    'index': item.get('index', 0),  # 0 = top item
-                    'title': '',
-                    'content': item.get('main_content', ''),
-                    'image': '',  # Will contain absolute URL
-                    'link': '',   # Will contain absolute URL
-                    'date': '',
-                    'author': '',
-                    'word_count': item.get('word_count', 0)
-                }
-                
-                # Fill in extracted fields
-                for key, value in item.items():
-                    if key in auto_sub_selectors:
-                        if isinstance(value, list) and value:
-                            formatted_item[key] = value[0]
-                        elif value:
-                            formatted_item[key] = str(value)
-                
-                # Use main_content as content if no specific content found
-                if not formatted_item['content'] and item.get('main_content'):
-                    formatted_item['content'] = item.get('main_content', '')
-                
-                formatted_items.append(formatted_item)
+            # Format items with all fields at same level (already in correct order)
+            formatted_items = [_format_simple_item(item) for item in raw_items]
             
             response_data = {
                 'url': url,
@@ -374,12 +386,12 @@ def extract_simple_repeated_elements():
             return error_response(result.error if result else "Simple extraction failed", 400)
             
     except Exception as e:
-        current_app.logger.error(f"Simple array extraction error: {str(e)}")
+        current_app.logger.exception("Simple array extraction error: %s", e)
         return error_response("Simple extraction failed", 500)
 
 @api_v1.route('/content/array/batch', methods=['POST'])
-@apply_rate_limit("2 per minute")
-def batch_extract_repeated_elements():
+@limiter.limit("2 per minute")
+async def batch_extract_repeated_elements():
     """
     Extract repeated elements from multiple URLs with proper ordering and absolute URLs
     
@@ -398,13 +410,19 @@ def batch_extract_repeated_elements():
         }
     }
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         # Validate batch request
-        max_batch_size = min(current_app.config.get('MAX_BATCH_SIZE', 3), 3)
+        crawler_service = get_crawler_service()
+        max_batch_size = crawler_service.max_batch_size
         
         if not data or 'urls' not in data:
             return error_response("'urls' array is required", 400)
@@ -426,8 +444,9 @@ def batch_extract_repeated_elements():
         # Extract configuration
         sub_selectors = config.get('sub_selectors', {})
         limit = min(config.get('limit', 20), 50)
-        exclude_selectors = config.get('exclude_selectors', [])
-        max_concurrent = min(config.get('max_concurrent', 2), 2)
+        exclude_selectors = _clean_selectors(config.get('exclude_selectors'))
+        # Crawls are network-bound, so by default every URL in the batch runs at once
+        max_concurrent = min(config.get('max_concurrent', max_batch_size), max_batch_size)
         
         array_selectors = {
             'items': {
@@ -437,12 +456,10 @@ def batch_extract_repeated_elements():
             }
         }
         
-        crawler_service = ArrayBasedCrawlerService(current_app.config)
-        
         try:
-            results = safe_async_run(
+            results = await asyncio.wait_for(
                 crawler_service.crawl_multiple_array_content(
-                    urls, array_selectors, exclude_selectors, 'structured', max_concurrent
+                    urls, array_selectors, exclude_selectors, 'none', max_concurrent
                 ),
                 timeout=120
             )
@@ -454,37 +471,16 @@ def batch_extract_repeated_elements():
         total_items = 0
         successful_extractions = 0
         
-        for i, result in enumerate(results):
-            url = urls[i] if i < len(urls) else "unknown"
-            
-            if result and result.success:
-                arrays_data = result.metadata.get('arrays', {})
-                items_data = arrays_data.get('items', {})
-                raw_items = items_data.get('items', [])
+        sub_keys = tuple(sub_selectors)
+        
+        # The service returns exactly one CrawlResult per URL, in order
+        for url, result in zip(urls, results):
+            if result.success:
+                metadata = result.metadata or {}
+                raw_items = metadata.get('arrays', {}).get('items', {}).get('items', [])
                 
                 # Format items for this URL (preserve order)
-                formatted_items = []
-                for item in raw_items:
-                    formatted_item = {
-                        'index': item.get('index', 0),  # Order preserved
-                        'main_content': item.get('main_content', ''),
-                        'word_count': item.get('word_count', 0)
-                    }
-                    
-                    # Add sub-selector fields
-                    for key, value in item.items():
-                        if key not in ['index', 'main_content', 'word_count', 'char_count']:
-                            if isinstance(value, list) and value:
-                                formatted_item[key] = value[0]
-                            elif value:
-                                formatted_item[key] = str(value)
-                    
-                    # Ensure all sub_selectors are present
-                    for sub_key in sub_selectors.keys():
-                        if sub_key not in formatted_item:
-                            formatted_item[sub_key] = ''
-                    
-                    formatted_items.append(formatted_item)
+                formatted_items = [_format_batch_item(item, sub_keys) for item in raw_items]
                 
                 batch_results.append({
                     'url': url,
@@ -502,12 +498,12 @@ def batch_extract_repeated_elements():
                 batch_results.append({
                     'url': url,
                     'success': False,
-                    'error': result.error if result else "Extraction failed",
+                    'error': result.error or "Extraction failed",
                     'total_found': 0,
                     'items': []
                 })
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         response_data = {
             'total_urls_processed': len(urls),
@@ -528,64 +524,59 @@ def batch_extract_repeated_elements():
         return success_response(response_data)
         
     except Exception as e:
-        current_app.logger.error(f"Batch array extraction error: {str(e)}")
+        current_app.logger.exception("Batch array extraction error: %s", e)
         return error_response("Batch extraction failed", 500)
 
-# Simple demo endpoint for quick testing
-@api_v1.route('/content/array/demo', methods=['GET'])
-@apply_rate_limit("30 per minute")
-def demo_array_extraction():
-    """Demo endpoint showing proper usage with order preservation and absolute URLs"""
-    try:
-        return success_response({
-            "message": "Array Content Extraction API - Order Preserved & Absolute URLs",
-            "description": "Extract repeated elements maintaining top-to-bottom order with absolute image/link URLs",
-            "key_features": {
-                "order_preservation": "Items returned in same order as they appear on webpage (index 0 = top item)",
-                "absolute_urls": "All image and link URLs converted to absolute URLs",
-                "deduplication": "Removes duplicate content while preserving order",
-                "flexible_selectors": "Support for custom CSS selectors for any content type"
-            },
-            "endpoints": {
-                "main": {
-                    "url": "POST /api/v1/content/array",
-                    "description": "Custom extraction with your own sub-selectors"
-                },
-                "simple": {
-                    "url": "POST /api/v1/content/array/simple", 
-                    "description": "Auto-detect common fields (title, content, image, link, date, author)"
-                },
-                "batch": {
-                    "url": "POST /api/v1/content/array/batch",
-                    "description": "Extract from multiple URLs"
-                }
-            },
-            "example_request": {
-                "url": "https://news-site.com",
-                "selector": ".news-item",
-                "config": {
-                    "sub_selectors": {
-                        "title": "h2 a",
-                        "summary": "p",
-                        "image": "img",
-                        "date": ".date",
-                        "link": "a"
-                    },
-                    "limit": 10
-                }
-            },
-            "example_response_item": {
-                "index": 0,
-                "title": "Latest News Title",
-                "summary": "News summary...",
-                "image": "https://news-site.com/images/news.jpg",
-                "date": "2024-01-15",
-                "link": "https://news-site.com/news/latest",
-                "main_content": "Full article content...",
-                "word_count": 150,
-                "note": "index 0 = top item on page, URLs are absolute"
+# Demo payload is static, so it is serialized once at import
+_DEMO_PAYLOAD = {
+    "message": "Array Content Extraction API - Order Preserved & Absolute URLs",
+    "description": "Extract repeated elements maintaining top-to-bottom order with absolute image/link URLs",
+    "key_features": {
+        "order_preservation": "Items returned in same order as they appear on webpage (index 0 = top item)",
+        "absolute_urls": "All image and link URLs converted to absolute URLs",
+        "deduplication": "Removes duplicate content while preserving order",
+        "flexible_selectors": "Support for custom CSS selectors for any content type"
+    },
+    "endpoints": {
+        "main": {
+            "url": "POST /api/v1/content/array",
+            "description": "Custom extraction with your own sub-selectors"
+        },
+        "simple": {
+            "url": "POST /api/v1/content/array/simple", 
+            "description": "Auto-detect common fields (title, content, image, link, date, author)"
+        },
+        "batch": {
+            "url": "POST /api/v1/content/array/batch",
+            "description": "Extract from multiple URLs"
+        }
+    },
+    "example_request": {
+        "url": "https://news-site.com",
+        "selector": ".news-item",
+        "config": {
+            "sub_selectors": {
+                "title": "h2 a",
+                "summary": "p",
+                "image": "img",
+                "date": ".date",
+                "link": "a"
             },
-            "python_usage": '''
+            "limit": 10
+        }
+    },
+    "example_response_item": {
+        "index": 0,
+        "title": "Latest News Title",
+        "summary": "News summary...",
+        "image": "https://news-site.com/images/news.jpg",
+        "date": "2024-01-15",
+        "link": "https://news-site.com/news/latest",
+        "main_content": "Full article content...",
+        "word_count": 150,
+        "note": "index 0 = top item on page, URLs are absolute"
+    },
+    "python_usage": '''
 import requests
 
 # Extract news articles in order
@@ -609,9 +600,22 @@ if data['success']:
         print(f"Image: {item['image']}")  # Absolute URL
         print(f"Link: {item['link']}")    # Absolute URL
             ''',
-            "order_guarantee": "Items always returned in top-to-bottom order as they appear on the webpage",
-            "url_guarantee": "All image and link URLs converted to absolute URLs for direct usage",
-            "status": "ready"
-        })
+    "order_guarantee": "Items always returned in top-to-bottom order as they appear on the webpage",
+    "url_guarantee": "All image and link URLs converted to absolute URLs for direct usage",
+    "status": "ready"
+}
+_DEMO_RESPONSE_BODY = dumps_static({"success": True, "message": "Success", **_DEMO_PAYLOAD}) + b"\n"
+
+# Simple demo endpoint for quick testing
+@api_v1.route('/content/array/demo', methods=['GET'])
+@limiter.limit("30 per minute")
+def demo_array_extraction():
+    """Demo endpoint showing proper usage with order preservation and absolute URLs"""
+    try:
+        response = current_app.response_class(_DEMO_RESPONSE_BODY, mimetype='application/json')
+        # The body never changes, so clients and proxies may reuse it
+        response.cache_control.public = True
+        response.cache_control.max_age = 300
+        return response
     except Exception as e:
         return error_response(f"Demo failed: {str(e)}", 500)
\ No newline at end of file
@@ -1,63 +1,50 @@
 # app/api/v1/content_only.py
-from flask import request, jsonify, current_app
+from flask import jsonify, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
 import asyncio
 import time
-import traceback
-import os
-from functools import wraps
 
 from app.api.v1 import api_v1
+from app.extensions import limiter
 from app.services.content_only_service import ContentOnlyCrawlerService
 from app.utils.validators import validate_crawl_request, validate_batch_request
 from app.utils.response_helpers import success_response, error_response
+from app.utils.request_helpers import read_json
+from app.utils.json_provider import dumps_static
+from app.utils.async_runner import run_async
 
-# Rate limiting decorator (using same pattern as crawl.py)
-def apply_rate_limit(limit_string):
-    """Apply rate limit only in production without valid API key"""
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            # Skip rate limiting in development
-            if os.getenv('FLASK_ENV', 'production') == 'development':
-                return f(*args, **kwargs)
-            
-            # Check for API key
-            api_key = request.headers.get('X-API-Key')
-            valid_api_key = os.getenv('API_KEY', '')
-            
-            if api_key and api_key == valid_api_key and valid_api_key:
-                # Valid API key - no rate limiting
-                return f(*args, **kwargs)
-            
-            # Apply rate limiting (would need to import limiter from crawl.py)
-            return f(*args, **kwargs)
-        
-        return decorated_function
-    return decorator
+_HTTP_PREFIXES = ('http://', 'https://')
+
+@api_v1.record_once
+def init_content_service(state):
+    """Create the app's shared ContentOnlyCrawlerService when the blueprint is registered"""
+    state.app.extensions['content_only_crawler'] = ContentOnlyCrawlerService(state.app.config)
+
+def get_content_service():
+    """Return the app's shared ContentOnlyCrawlerService"""
+    return current_app.extensions['content_only_crawler']
 
 def safe_async_run(coro, timeout=30):
-    """Safely run async coroutine with proper event loop handling"""
+    """Safely run async coroutine on the shared background event loop"""
     try:
-        try:
-            loop = asyncio.get_running_loop()
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result(timeout=timeout)
-        except RuntimeError:
-            return asyncio.run(coro)
+        return run_async(coro, timeout)
     except Exception as e:
-        current_app.logger.error(f"Async execution error: {str(e)}")
+        current_app.logger.error("Async execution error: %s", e)
         raise e
 
 @api_v1.route('/content', methods=['POST'])
-@apply_rate_limit("20 per minute")
+@limiter.limit("20 per minute")
 def extract_content_only():
     """Extract only clean text content without images and links"""
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         # Validate request
         is_valid, error_msg = validate_crawl_request(data)
@@ -71,7 +58,7 @@ def extract_content_only():
         max_length = min(config.get('max_content_length', 5000), 20000)
         
         # Initialize content-only crawler service
-        crawler_service = ContentOnlyCrawlerService(current_app.config)
+        crawler_service = get_content_service()
         
         # Run content extraction
         try:
@@ -82,8 +69,7 @@ def extract_content_only():
         except asyncio.TimeoutError:
             return error_response("Content extraction timeout after 25 seconds", 408)
         except Exception as crawl_error:
-            current_app.logger.error(f"Content extraction failed: {str(crawl_error)}")
-            current_app.logger.error(f"Traceback: {traceback.format_exc()}")
+            current_app.logger.exception("Content extraction failed: %s", crawl_error)
             return error_response(f"Content extraction failed: {str(crawl_error)}", 500)
         
         # Add timing information
@@ -98,18 +84,22 @@ def extract_content_only():
             return error_response(error_msg, 400)
             
     except Exception as e:
-        current_app.logger.error(f"Content-only endpoint error: {str(e)}")
-        current_app.logger.error(f"Full traceback: {traceback.format_exc()}")
+        current_app.logger.exception("Content-only endpoint error: %s", e)
         return error_response("Internal server error", 500)
 
 @api_v1.route('/content/fast', methods=['POST'])
-@apply_rate_limit("30 per minute")
+@limiter.limit("30 per minute")
 def extract_content_ultra_fast():
     """Ultra-fast content extraction with aggressive limits"""
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         is_valid, error_msg = validate_crawl_request(data)
         if not is_valid:
@@ -121,7 +111,7 @@ def extract_content_ultra_fast():
         # Ultra-fast: smaller content limit
         max_length = min(config.get('max_content_length', 2000), 5000)
         
-        crawler_service = ContentOnlyCrawlerService(current_app.config)
+        crawler_service = get_content_service()
         
         try:
             result = safe_async_run(
@@ -131,7 +121,7 @@ def extract_content_ultra_fast():
         except asyncio.TimeoutError:
             return error_response("Ultra-fast content extraction timeout after 15 seconds", 408)
         except Exception as crawl_error:
-            current_app.logger.error(f"Ultra-fast content extraction failed: {str(crawl_error)}")
+            current_app.logger.error("Ultra-fast content extraction failed: %s", crawl_error)
             return error_response(f"Ultra-fast content extraction failed: {str(crawl_error)}", 500)
         
         total_time = time.time() - start_time
@@ -145,17 +135,22 @@ def extract_content_ultra_fast():
             return error_response(error_msg, 400)
             
     except Exception as e:
-        current_app.logger.error(f"Ultra-fast content extraction error: {str(e)}")
+        current_app.logger.error("Ultra-fast content extraction error: %s", e)
         return error_response("Internal server error", 500)
 
 @api_v1.route('/content/batch', methods=['POST'])
-@apply_rate_limit("5 per minute")  # Very strict for batch
+@limiter.limit("5 per minute")  # Very strict for batch
 def batch_extract_content():
     """Batch content extraction without images and links"""
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         max_batch_size = min(current_app.config.get('MAX_BATCH_SIZE', 5), 5)
         is_valid, error_msg = validate_batch_request(data, max_batch_size)
@@ -169,7 +164,7 @@ def batch_extract_content():
         max_length = min(config.get('max_content_length', 2000), 4000)  # Smaller for batch
         max_concurrent = min(config.get('max_concurrent', 2), 3)
         
-        crawler_service = ContentOnlyCrawlerService(current_app.config)
+        crawler_service = get_content_service()
         
         try:
             results = safe_async_run(
@@ -179,30 +174,13 @@ def batch_extract_content():
         except asyncio.TimeoutError:
             return error_response("Batch content extraction timeout after 60 seconds", 408)
         except Exception as crawl_error:
-            current_app.logger.error(f"Batch content extraction failed: {str(crawl_error)}")
+            current_app.logger.error("Batch content extraction failed: %s", crawl_error)
             return error_response(f"Batch content extraction failed: {str(crawl_error)}", 500)
         
-        # Process results
-        if results:
-            result_dicts = []
-            successful = 0
-            failed = 0
-            
-            for result in results:
-                try:
-                    result_dict = result.to_dict() if result else {"success": False, "error": "No result"}
-                    result_dicts.append(result_dict)
-                    if result and result.success:
-                        successful += 1
-                    else:
-                        failed += 1
-                except Exception as e:
-                    result_dicts.append({"success": False, "error": f"Result processing error: {str(e)}"})
-                    failed += 1
-        else:
-            result_dicts = []
-            successful = 0
-            failed = len(urls)
+        # Process results: the service returns one CrawlResult per URL, in order
+        result_dicts = [result.to_dict() for result in results]
+        successful = sum(1 for result in results if result.success)
+        failed = len(result_dicts) - successful
         
         total_time = time.time() - start_time
         
@@ -222,24 +200,23 @@ def batch_extract_content():
         })
         
     except Exception as e:
-        current_app.logger.error(f"Batch content extraction error: {str(e)}")
-        current_app.logger.error(f"Full traceback: {traceback.format_exc()}")
+        current_app.logger.exception("Batch content extraction error: %s", e)
         return error_response("Batch content processing failed", 500)
 
 @api_v1.route('/content/<path:url>', methods=['GET'])
-@apply_rate_limit("40 per minute")
+@limiter.limit("40 per minute")
 def extract_content_get(url):
     """Quick content-only extraction via GET request"""
     start_time = time.time()
     
     try:
-        if not url.startswith(('http://', 'https://')):
+        if not url.startswith(_HTTP_PREFIXES):
             url = 'https://' + url
 
         # Very fast content extraction
         max_length = 1500  # Small for GET requests
         
-        crawler_service = ContentOnlyCrawlerService(current_app.config)
+        crawler_service = get_content_service()
         
         try:
             result = safe_async_run(
@@ -249,7 +226,7 @@ def extract_content_get(url):
         except asyncio.TimeoutError:
             return error_response("GET content extraction timeout after 10 seconds", 408)
         except Exception as crawl_error:
-            current_app.logger.error(f"GET content extraction failed: {str(crawl_error)}")
+            current_app.logger.error("GET content extraction failed: %s", crawl_error)
             return error_response(f"GET content extraction failed: {str(crawl_error)}", 500)
         
         total_time = time.time() - start_time
@@ -263,31 +240,35 @@ def extract_content_get(url):
             return error_response(error_msg, 400)
             
     except Exception as e:
-        current_app.logger.error(f"GET content extraction error: {str(e)}")
+        current_app.logger.error("GET content extraction error: %s", e)
         return error_response("GET content request failed", 500)
 
+# Test payload is static, so the response body is serialized once at import
+_TEST_PAYLOAD = {
+    "message": "Content-only extraction service is ready",
+    "endpoints": {
+        "content": "POST /api/v1/content",
+        "content_fast": "POST /api/v1/content/fast", 
+        "content_batch": "POST /api/v1/content/batch",
+        "content_get": "GET /api/v1/content/<url>"
+    },
+    "features": {
+        "images_removed": "All images are removed from content",
+        "links_removed": "All links are removed but text is kept",
+        "clean_text": "Only clean, readable text content is returned",
+        "main_content": "Prioritizes main content areas over navigation/sidebars",
+        "fast_extraction": "Optimized for speed with minimal processing"
+    },
+    "status": "healthy",
+    "service": "Content-Only Extraction API"
+}
+_TEST_RESPONSE_BODY = dumps_static({"success": True, "message": "Success", **_TEST_PAYLOAD}) + b"\n"
+
 @api_v1.route('/content/test', methods=['GET'])
-@apply_rate_limit("60 per minute")
+@limiter.limit("60 per minute")
 def test_content_extraction():
     """Test endpoint for content-only extraction"""
     try:
-        return success_response({
-            "message": "Content-only extraction service is ready",
-            "endpoints": {
-                "content": "POST /api/v1/content",
-                "content_fast": "POST /api/v1/content/fast", 
-                "content_batch": "POST /api/v1/content/batch",
-                "content_get": "GET /api/v1/content/<url>"
-            },
-            "features": {
-                "images_removed": "All images are removed from content",
-                "links_removed": "All links are removed but text is kept",
-                "clean_text": "Only clean, readable text content is returned",
-                "main_content": "Prioritizes main content areas over navigation/sidebars",
-                "fast_extraction": "Optimized for speed with minimal processing"
-            },
-            "status": "healthy",
-            "service": "Content-Only Extraction API"
-        })
+        return current_app.response_class(_TEST_RESPONSE_BODY, mimetype='application/json')
     except Exception as e:
         return error_response(f"Content extraction test failed: {str(e)}", 500)
\ No newline at end of file
@@ -1,113 +1,43 @@
 # app/api/v1/crawl.py - Updated with conditional rate limiting
 
-from flask import request, jsonify, current_app
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
+from flask import request, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
 import asyncio
 import time
 import sys
-import traceback
-import os
-from functools import wraps
 from app.api.v1 import api_v1
+from app.extensions import limiter, ENVIRONMENT, IS_DEVELOPMENT
 from app.services.crawler_service import CrawlerService
 from app.models.crawler_models import CrawlConfig
 from app.utils.validators import validate_crawl_request, validate_batch_request
 from app.utils.response_helpers import success_response, error_response
+from app.utils.request_helpers import read_json
+from app.utils.async_runner import run_async
+from app.utils.api_keys import is_valid_api_key
 
-# Custom key function that checks for API key
-def get_rate_limit_key():
-    """Get rate limit key based on API key or IP address"""
-    # Check if we're in development mode
-    if os.getenv('FLASK_ENV', 'production') == 'development':
-        return None  # No rate limiting in development
-    
-    # Check for API key in headers
-    api_key = request.headers.get('X-API-Key')
-    if api_key:
-        # Validate API key
-        valid_api_key = os.getenv('API_KEY', '')
-        if api_key == valid_api_key and valid_api_key:
-            return None  # No rate limiting for valid API key
-    
-    # Default to IP-based rate limiting
-    return get_remote_address()
-
-# Initialize rate limiter with custom key function
-limiter = Limiter(
-    key_func=get_rate_limit_key,
-    default_limits=["100 per hour", "20 per minute"],
-    storage_uri="memory://",
-    enabled=os.getenv('FLASK_ENV', 'production') != 'development'  # Disable in development
-)
-
-# Custom decorator to handle rate limiting with better error messages
-def apply_rate_limit(limit_string):
-    """Apply rate limit only in production without valid API key"""
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            # Skip rate limiting in development
-            if os.getenv('FLASK_ENV', 'production') == 'development':
-                return f(*args, **kwargs)
-            
-            # Check for API key
-            api_key = request.headers.get('X-API-Key')
-            valid_api_key = os.getenv('API_KEY', '')
-            
-            if api_key and api_key == valid_api_key and valid_api_key:
-                # Valid API key - no rate limiting
-                return f(*args, **kwargs)
-            
-            # Apply rate limiting
-            return limiter.limit(limit_string)(f)(*args, **kwargs)
-        
-        return decorated_function
-    return decorator
-
-# Error handler for rate limit exceeded
-@limiter.request_filter
-def rate_limit_filter():
-    """Filter to check if rate limiting should be applied"""
-    # Don't rate limit in development
-    if os.getenv('FLASK_ENV', 'production') == 'development':
-        return True
-    
-    # Don't rate limit if valid API key is provided
-    api_key = request.headers.get('X-API-Key')
-    valid_api_key = os.getenv('API_KEY', '')
-    
-    if api_key and api_key == valid_api_key and valid_api_key:
-        return True
-    
-    return False
+_HTTP_PREFIXES = ('http://', 'https://')
 
 def safe_async_run(coro, timeout=30):
-    """Safely run async coroutine with proper event loop handling"""
+    """Safely run async coroutine on the shared background event loop"""
     try:
-        # Try to get existing event loop
-        try:
-            loop = asyncio.get_running_loop()
-            # If we're already in an event loop, create a new thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result(timeout=timeout)
-        except RuntimeError:
-            # No running loop, safe to create new one
-            return asyncio.run(coro)
+        return run_async(coro, timeout)
     except Exception as e:
         current_app.logger.error(f"Async execution error: {str(e)}")
         raise e
 
 @api_v1.route('/crawl', methods=['POST'])
-@apply_rate_limit("15 per minute")
+@limiter.limit("15 per minute")
 def crawl_url():
     """High-speed single URL crawling endpoint with robust error handling"""
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         # Validate request
         is_valid, error_msg = validate_crawl_request(data)
@@ -146,8 +76,7 @@ def crawl_url():
         except asyncio.TimeoutError:
             return error_response("Request timeout after 30 seconds", 408)
         except Exception as crawl_error:
-            current_app.logger.error(f"Crawl execution failed: {str(crawl_error)}")
-            current_app.logger.error(f"Traceback: {traceback.format_exc()}")
+            current_app.logger.exception("Crawl execution failed: %s", crawl_error)
             return error_response(f"Crawl failed: {str(crawl_error)}", 500)
         
         # Add timing information
@@ -161,18 +90,22 @@ def crawl_url():
             return error_response(error_msg, 400)
             
     except Exception as e:
-        current_app.logger.error(f"Crawl endpoint error: {str(e)}")
-        current_app.logger.error(f"Full traceback: {traceback.format_exc()}")
+        current_app.logger.exception("Crawl endpoint error: %s", e)
         return error_response("Internal server error", 500)
 
 @api_v1.route('/crawl/fast', methods=['POST'])
-@apply_rate_limit("20 per minute")
+@limiter.limit("20 per minute")
 def crawl_url_ultra_fast():
     """Ultra-fast crawling with minimal processing"""
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         is_valid, error_msg = validate_crawl_request(data)
         if not is_valid:
@@ -224,13 +157,18 @@ def crawl_url_ultra_fast():
         return error_response("Internal server error", 500)
 
 @api_v1.route('/crawl/batch', methods=['POST'])
-@apply_rate_limit("3 per minute")  # Very strict for batch
+@limiter.limit("3 per minute")  # Very strict for batch
 def batch_crawl():
     """High-speed batch URL crawling with concurrency"""
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         max_batch_size = min(current_app.config.get('MAX_BATCH_SIZE', 5), 5)  # Cap at 5
         is_valid, error_msg = validate_batch_request(data, max_batch_size)
@@ -303,18 +241,17 @@ def batch_crawl():
         })
         
     except Exception as e:
-        current_app.logger.error(f"Batch crawl error: {str(e)}")
-        current_app.logger.error(f"Full traceback: {traceback.format_exc()}")
+        current_app.logger.exception("Batch crawl error: %s", e)
         return error_response("Batch processing failed", 500)
 
 @api_v1.route('/crawl/<path:url>', methods=['GET'])
-@apply_rate_limit("30 per minute")
+@limiter.limit("30 per minute")
 def crawl_get_endpoint(url):
     """Lightning-fast GET endpoint"""
     start_time = time.time()
     
     try:
-        if not url.startswith(('http://', 'https://')):
+        if not url.startswith(_HTTP_PREFIXES):
             url = 'https://' + url
 
         # Ultra-minimal config for GET requests
@@ -357,19 +294,14 @@ def crawl_get_endpoint(url):
 
 # Health check for debugging
 @api_v1.route('/crawl/test', methods=['GET'])
-@apply_rate_limit("60 per minute")
+@limiter.limit("60 per minute")
 def test_crawl():
     """Simple test endpoint"""
     try:
         # Check current environment and API key status
-        is_development = os.getenv('FLASK_ENV', 'production') == 'development'
-        has_api_key = bool(request.headers.get('X-API-Key'))
-        api_key_valid = False
-        
-        if has_api_key:
-            provided_key = request.headers.get('X-API-Key')
-            valid_key = os.getenv('API_KEY', '')
-            api_key_valid = provided_key == valid_key and valid_key != ''
+        provided_key = request.headers.get('X-API-Key')
+        has_api_key = bool(provided_key)
+        api_key_valid = is_valid_api_key(provided_key)
         
         return success_response({
             "message": "Crawler service is ready",
@@ -381,27 +313,12 @@ def test_crawl():
             },
             "status": "healthy",
             "rate_limiting": {
-                "environment": os.getenv('FLASK_ENV', 'production'),
-                "is_development": is_development,
-                "rate_limit_active": not is_development and not api_key_valid,
+                "environment": ENVIRONMENT,
+                "is_development": IS_DEVELOPMENT,
+                "rate_limit_active": not IS_DEVELOPMENT and not api_key_valid,
                 "has_api_key": has_api_key,
                 "api_key_valid": api_key_valid
             }
         })
     except Exception as e:
         return error_response(f"Test failed: {str(e)}", 500)
-
-# Add custom error handler for rate limit exceeded
-@api_v1.errorhandler(429)
-def rate_limit_handler(e):
-    """Custom handler for rate limit exceeded"""
-    return jsonify({
-        'success': False,
-        'error': 'Rate limit exceeded',
-        'message': 'Too many requests. Please try again later or use an API key for unlimited access.',
-        'details': {
-            'retry_after_seconds': 60,
-            'api_key_header': 'X-API-Key',
-            'documentation': '/api/v1/docs'
-        }
-    }), 429
\ No newline at end of file
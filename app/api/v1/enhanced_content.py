@@ -1,53 +1,33 @@
 # app/api/v1/enhanced_content.py
 from flask import request, jsonify, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
 import asyncio
 import time
-import traceback
-import os
-from functools import wraps
 
 from app.api.v1 import api_v1
+from app.extensions import limiter
 from app.services.enhanced_content_service import EnhancedContentOnlyCrawlerService
 from app.utils.validators import validate_crawl_request, validate_batch_request
 from app.utils.response_helpers import success_response, error_response
+from app.utils.request_helpers import read_json
+from app.utils.async_runner import run_async
 
-# Rate limiting decorator
-def apply_rate_limit(limit_string):
-    """Apply rate limit only in production without valid API key"""
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            if os.getenv('FLASK_ENV', 'production') == 'development':
-                return f(*args, **kwargs)
-            
-            api_key = request.headers.get('X-API-Key')
-            valid_api_key = os.getenv('API_KEY', '')
-            
-            if api_key and api_key == valid_api_key and valid_api_key:
-                return f(*args, **kwargs)
-            
-            return f(*args, **kwargs)
-        
-        return decorated_function
-    return decorator
+_HTTP_PREFIXES = ('http://', 'https://')
+
+def _split_csv(param):
+    """Split a comma-separated query parameter into stripped, non-empty values"""
+    return [value for value in (part.strip() for part in param.split(',')) if value]
 
 def safe_async_run(coro, timeout=30):
-    """Safely run async coroutine with proper event loop handling"""
+    """Safely run async coroutine on the shared background event loop"""
     try:
-        try:
-            loop = asyncio.get_running_loop()
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result(timeout=timeout)
-        except RuntimeError:
-            return asyncio.run(coro)
+        return run_async(coro, timeout)
     except Exception as e:
         current_app.logger.error(f"Async execution error: {str(e)}")
         raise e
 
 @api_v1.route('/content/selective', methods=['POST'])
-@apply_rate_limit("15 per minute")
+@limiter.limit("15 per minute")
 def extract_content_with_selectors():
     """
     Extract content from specific div elements using CSS selectors - WITH DEDUPLICATION
@@ -66,7 +46,12 @@ def extract_content_with_selectors():
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         # Validate request
         is_valid, error_msg = validate_crawl_request(data)
@@ -96,10 +81,10 @@ def extract_content_with_selectors():
             return error_response("Maximum 5 exclude selectors allowed", 400)
         
         # Log the request for debugging
-        current_app.logger.info(f"Selective content extraction request:")
-        current_app.logger.info(f"  URL: {url}")
-        current_app.logger.info(f"  Selectors: {custom_selectors}")
-        current_app.logger.info(f"  Exclude: {exclude_selectors}")
+        current_app.logger.info(
+            "Selective content extraction request: url=%s selectors=%s exclude=%s",
+            url, custom_selectors, exclude_selectors
+        )
         
         # Initialize enhanced crawler service
         crawler_service = EnhancedContentOnlyCrawlerService(current_app.config)
@@ -115,8 +100,7 @@ def extract_content_with_selectors():
         except asyncio.TimeoutError:
             return error_response("Selective content extraction timeout after 30 seconds", 408)
         except Exception as crawl_error:
-            current_app.logger.error(f"Selective content extraction failed: {str(crawl_error)}")
-            current_app.logger.error(f"Traceback: {traceback.format_exc()}")
+            current_app.logger.exception("Selective content extraction failed: %s", crawl_error)
             return error_response(f"Selective content extraction failed: {str(crawl_error)}", 500)
         
         # Add timing information and enhanced metadata
@@ -141,24 +125,24 @@ def extract_content_with_selectors():
                     }
             
             # Log successful extraction
-            current_app.logger.info(f"Selective extraction successful:")
-            current_app.logger.info(f"  Content length: {len(result.content)}")
-            current_app.logger.info(f"  Sections found: {result.metadata.get('total_sections', 0)}")
-            current_app.logger.info(f"  Deduplication applied: {result.metadata.get('deduplication_applied', False)}")
+            current_app.logger.info(
+                "Selective extraction successful: length=%d sections=%s deduplicated=%s",
+                len(result.content), result.metadata.get('total_sections', 0),
+                result.metadata.get('deduplication_applied', False)
+            )
             
             return success_response(result.to_dict())
         else:
             error_msg = result.error if result else "Selective content extraction failed"
-            current_app.logger.error(f"Extraction failed: {error_msg}")
+            current_app.logger.error("Extraction failed: %s", error_msg)
             return error_response(error_msg, 400)
             
     except Exception as e:
-        current_app.logger.error(f"Selective content endpoint error: {str(e)}")
-        current_app.logger.error(f"Full traceback: {traceback.format_exc()}")
+        current_app.logger.exception("Selective content endpoint error: %s", e)
         return error_response("Internal server error", 500)
 
 @api_v1.route('/content/selective/batch', methods=['POST'])
-@apply_rate_limit("3 per minute")
+@limiter.limit("3 per minute")
 def batch_extract_content_with_selectors():
     """
     Batch extract content using custom selectors with deduplication
@@ -177,7 +161,12 @@ def batch_extract_content_with_selectors():
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         max_batch_size = min(current_app.config.get('MAX_BATCH_SIZE', 5), 5)
         is_valid, error_msg = validate_batch_request(data, max_batch_size)
@@ -271,12 +260,11 @@ def batch_extract_content_with_selectors():
         })
         
     except Exception as e:
-        current_app.logger.error(f"Batch selective content error: {str(e)}")
-        current_app.logger.error(f"Full traceback: {traceback.format_exc()}")
+        current_app.logger.exception("Batch selective content error: %s", e)
         return error_response("Batch selective content processing failed", 500)
 
 @api_v1.route('/content/selective/<path:url>', methods=['GET'])
-@apply_rate_limit("25 per minute")
+@limiter.limit("25 per minute")
 def extract_content_selective_get(url):
     """
     Quick selective content extraction via GET with query parameters
@@ -289,17 +277,17 @@ def extract_content_selective_get(url):
     start_time = time.time()
     
     try:
-        if not url.startswith(('http://', 'https://')):
+        if not url.startswith(_HTTP_PREFIXES):
             url = 'https://' + url
         
         # Parse query parameters
-        selectors_param = request.args.get('selectors', '')
-        exclude_param = request.args.get('exclude', '')
-        max_length = min(int(request.args.get('length', 2000)), 5000)
+        args = request.args
+        # A malformed length falls back to the default instead of failing the request
+        max_length = min(args.get('length', 2000, type=int), 5000)
         
         # Parse selectors from comma-separated string
-        custom_selectors = [s.strip() for s in selectors_param.split(',') if s.strip()] if selectors_param else []
-        exclude_selectors = [s.strip() for s in exclude_param.split(',') if s.strip()] if exclude_param else []
+        custom_selectors = _split_csv(args.get('selectors', ''))
+        exclude_selectors = _split_csv(args.get('exclude', ''))
         
         # Validate
         if len(custom_selectors) > 5:  # Stricter limit for GET
@@ -338,7 +326,7 @@ def extract_content_selective_get(url):
         return error_response("GET selective content request failed", 500)
 
 @api_v1.route('/content/analyze', methods=['POST'])
-@apply_rate_limit("10 per minute")
+@limiter.limit("10 per minute")
 def analyze_page_structure():
     """
     Analyze page structure and suggest optimal selectors
@@ -356,7 +344,12 @@ def analyze_page_structure():
     start_time = time.time()
     
     try:
-        data = request.get_json()
+        try:
+            data = read_json()
+        except RequestEntityTooLarge:
+            return error_response("Request too large", 413)
+        except ValueError:
+            return error_response("Invalid JSON", 400)
         
         is_valid, error_msg = validate_crawl_request(data)
         if not is_valid:
@@ -448,7 +441,7 @@ def analyze_page_structure():
         return error_response("Structure analysis failed", 500)
 
 @api_v1.route('/content/selective/test', methods=['GET'])
-@apply_rate_limit("60 per minute")
+@limiter.limit("60 per minute")
 def test_selective_extraction():
     """Test endpoint for selective content extraction with enhanced documentation"""
     try:
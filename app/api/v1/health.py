@@ -1,19 +1,27 @@
 from flask import jsonify, current_app
 from app.api.v1 import api_v1
-from app.utils.response_helpers import success_response
+from types import MappingProxyType
 import time
 import os
 
+@api_v1.record_once
+def freeze_health_payload(state):
+    """Build the static part of the health payloads once at registration time"""
+    config = state.app.config
+    state.app.extensions['health_payload'] = MappingProxyType({
+        'success': True,
+        'message': 'Success',
+        'status': 'healthy',
+        'service': config.get('API_TITLE', 'Web Crawler API'),
+        'version': config.get('API_VERSION', 'v1'),
+        'environment': config.get('ENV', 'development')
+    })
+
 @api_v1.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return success_response({
-        'status': 'healthy',
-        'service': current_app.config.get('API_TITLE', 'Web Crawler API'),
-        'version': current_app.config.get('API_VERSION', 'v1'),
-        'environment': current_app.config.get('ENV', 'development'),
-        'timestamp': time.time()
-    })
+    # Only the timestamp changes between hits
+    return jsonify({**current_app.extensions['health_payload'], 'timestamp': time.time()})
 
 @api_v1.route('/health/detailed', methods=['GET'])
 def detailed_health_check():
@@ -33,11 +41,8 @@ def detailed_health_check():
             'note': 'psutil not available for detailed system metrics'
         }
     
-    return success_response({
-        'status': 'healthy',
-        'service': current_app.config.get('API_TITLE', 'Web Crawler API'),
-        'version': current_app.config.get('API_VERSION', 'v1'),
-        'environment': current_app.config.get('ENV', 'development'),
+    return jsonify({
+        **current_app.extensions['health_payload'],
         'system': system_info,
         'timestamp': time.time()
     })
\ No newline at end of file
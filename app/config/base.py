@@ -10,13 +10,15 @@ class BaseConfig:
     API_VERSION = 'v1'
     
     # Rate limiting
-    RATELIMIT_STORAGE_URL = os.getenv('REDIS_URL', 'memory://')
+    RATELIMIT_STORAGE_URI = os.getenv('RATELIMIT_STORAGE_URI', 'memory://')
     RATELIMIT_DEFAULT = "100 per hour"
+    RATELIMIT_STRATEGY = os.getenv('RATELIMIT_STRATEGY', 'moving-window')
     
     # Crawler settings
     CRAWLER_TIMEOUT = int(os.getenv('CRAWLER_TIMEOUT', '30'))
     MAX_BATCH_SIZE = int(os.getenv('MAX_BATCH_SIZE', '10'))
-    MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', '5014'))
+    CRAWLER_MAX_CONTENT_LENGTH = int(os.getenv('CRAWLER_MAX_CONTENT_LENGTH', '5014'))
+    HTML_PARSER = os.getenv('HTML_PARSER', 'html.parser')
     
     # CORS
     ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', '*').split(',')
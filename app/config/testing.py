@@ -6,7 +6,7 @@ class TestingConfig(BaseConfig):
     TESTING = True
     
     # Use in-memory storage for tests
-    RATELIMIT_STORAGE_URL = 'memory://'
+    RATELIMIT_STORAGE_URI = 'memory://'
     
     # Disable rate limiting for tests
     RATELIMIT_DEFAULT = "10000 per hour"
@@ -0,0 +1,23 @@
+import os
+from flask import request
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from app.utils.api_keys import is_valid_api_key
+
+# Resolved once per process; these never change while the app is running
+ENVIRONMENT = os.getenv('FLASK_ENV', 'production')
+IS_DEVELOPMENT = ENVIRONMENT == 'development'
+
+# Shared rate limiter, bound to the app in create_app (no default limits: only decorated views are limited).
+# Storage, strategy and on/off come from the app's RATELIMIT_STORAGE_URI / RATELIMIT_STRATEGY /
+# RATELIMIT_ENABLED config; if that storage becomes unreachable, counting falls back to process
+# memory instead of failing the request.
+limiter = Limiter(
+    key_func=get_remote_address,
+    in_memory_fallback_enabled=True
+)
+
+@limiter.request_filter
+def has_valid_api_key():
+    """Requests carrying the configured API key are never rate limited"""
+    return is_valid_api_key(request.headers.get('X-API-Key'))
@@ -17,15 +17,32 @@ except ImportError:
     from crawl4ai.extraction_strategy import NoExtractionStrategy
 
 from app.utils.validators import validate_url
+from app.utils.selector_cache import compile_css
+from app.utils.html_parser import resolve_html_parser
 from app.models.crawler_models import CrawlResult, CrawlConfig
 
 logger = logging.getLogger(__name__)
 
+# Sub-selector names that extract a URL instead of text
+_IMAGE_FIELDS = frozenset(('image', 'img', 'picture', 'photo'))
+_LINK_FIELDS = frozenset(('link', 'url', 'href'))
+
+# Item keys produced by the extractor itself rather than by sub-selectors
+_INTERNAL_ITEM_FIELDS = frozenset(('index', 'main_content', 'word_count', 'char_count'))
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Distinguishes a missing crawler result attribute from one that is set to None
+_MISSING = object()
+
 
 class ArrayContentExtractor:
     """Extract content as arrays for repeated elements with proper ordering and image URLs"""
     
-    def __init__(self):
+    def __init__(self, parser: str = 'html.parser'):
+        # BeautifulSoup tree builder ('lxml' parses several times faster when installed)
+        self.parser = resolve_html_parser(parser)
+        
         # Tags to completely remove
         self.remove_tags = [
             'script', 'style', 'noscript', 'link', 'meta',
@@ -113,43 +130,24 @@ class ArrayContentExtractor:
         
         return ''
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two text strings"""
-        if not text1 or not text2:
-            return 0.0
-        return difflib.SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
-    
-    def _is_duplicate_content(self, content: str, existing_contents: List[str], threshold: float = 0.85) -> bool:
-        """Check if content is duplicate of existing content"""
-        if not content.strip() or len(content.strip()) < 20:
-            return True
-        
-        normalized_content = re.sub(r'\s+', ' ', content.strip().lower())
-        
-        for existing in existing_contents:
-            if not existing.strip():
-                continue
-                
-            normalized_existing = re.sub(r'\s+', ' ', existing.strip().lower())
-            
-            # Check exact match
-            if normalized_content == normalized_existing:
-                return True
-            
-            # Check similarity ratio
-            similarity = self._calculate_similarity(normalized_content, normalized_existing)
-            if similarity > threshold:
-                return True
-        
-        return False
+    @staticmethod
+    def _exceeds_similarity(matcher: difflib.SequenceMatcher, content: str, threshold: float) -> bool:
+        """Check content against a matcher's cached text, trying difflib's cheap upper bounds first"""
+        matcher.set_seq1(content)
+        return (matcher.real_quick_ratio() > threshold
+                and matcher.quick_ratio() > threshold
+                and matcher.ratio() > threshold)
     
     def _remove_duplicate_array_items(self, items: List[Dict]) -> List[Dict]:
         """Remove duplicate items from array based on main_content while preserving EXACT order"""
         if not items or len(items) <= 1:
             return items
         
+        threshold = 0.75
         unique_items = []
-        seen_contents = []
+        seen_contents = set()
+        # One matcher per kept item: difflib caches its analysis of the second sequence
+        seen_matchers = []
         
         # Process items in EXACT order to preserve top-to-bottom sequence
         # items[0] should be the first/top item on the webpage
@@ -159,12 +157,18 @@ class ArrayContentExtractor:
             if not main_content or len(main_content) < 20:
                 continue
             
-            # Check if this item is duplicate
-            if not self._is_duplicate_content(main_content, seen_contents, threshold=0.75):
-                unique_items.append(item)
-                seen_contents.append(main_content)
-            else:
-                logger.debug(f"Removed duplicate array item: {main_content[:50]}...")
+            # Normalize whitespace and case once per item
+            normalized_content = _WHITESPACE_RE.sub(' ', main_content.lower())
+            if normalized_content in seen_contents or any(
+                self._exceeds_similarity(matcher, normalized_content, threshold)
+                for matcher in seen_matchers
+            ):
+                logger.debug("Removed duplicate array item: %.50s...", main_content)
+                continue
+            
+            unique_items.append(item)
+            seen_contents.add(normalized_content)
+            seen_matchers.append(difflib.SequenceMatcher(None, b=normalized_content))
         
         # Re-index to maintain 0, 1, 2, 3... order where 0 = top item
         for i, item in enumerate(unique_items):
@@ -189,7 +193,7 @@ class ArrayContentExtractor:
             Dict with extracted arrays and metadata (preserving order, absolute URLs)
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, self.parser)
             
             # Remove unwanted tags completely
             for tag in soup(self.remove_tags):
@@ -199,7 +203,7 @@ class ArrayContentExtractor:
             if exclude_selectors:
                 for selector in exclude_selectors:
                     try:
-                        for element in soup.select(selector):
+                        for element in compile_css(selector).select(soup):
                             element.decompose()
                     except Exception as e:
                         logger.warning(f"Invalid exclude selector '{selector}': {str(e)}")
@@ -223,11 +227,20 @@ class ArrayContentExtractor:
                     if not selector:
                         continue
                     
-                    # Find all matching elements - PRESERVE ORDER (top to bottom)
-                    elements = soup.select(selector)
+                    # Find matching elements - PRESERVE ORDER (top to bottom)
+                    # Matching stops after the first N elements (top items) when a limit is set
+                    elements = compile_css(selector).select(soup, limit=limit or 0)
                     
-                    if limit and len(elements) > limit:
-                        elements = elements[:limit]  # Take first N elements (top items)
+                    # Resolve sub-selectors once per config instead of once per element
+                    compiled_sub_selectors = []
+                    if sub_selectors:
+                        for sub_name, sub_selector in sub_selectors.items():
+                            try:
+                                matcher = compile_css(sub_selector)
+                            except Exception as e:
+                                logger.warning(f"Error extracting sub-selector '{sub_name}': {str(e)}")
+                                matcher = None
+                            compiled_sub_selectors.append((sub_name, sub_name.lower(), matcher))
                     
                     array_items = []
                     
@@ -246,50 +259,51 @@ class ArrayContentExtractor:
                         }
                         
                         # Extract sub-selectors if specified
-                        if sub_selectors:
-                            for sub_name, sub_selector in sub_selectors.items():
-                                try:
-                                    # Handle special cases for images and links
-                                    if sub_name.lower() in ['image', 'img', 'picture', 'photo']:
-                                        # Extract image URL
-                                        img_elements = element.select(sub_selector)
-                                        if img_elements:
-                                            img_url = self._extract_image_url(img_elements[0], base_url)
-                                            item_data[sub_name] = img_url
-                                        else:
-                                            item_data[sub_name] = ''
-                                    
-                                    elif sub_name.lower() in ['link', 'url', 'href']:
-                                        # Extract link URL
-                                        link_elements = element.select(sub_selector)
-                                        if link_elements:
-                                            link_url = self._extract_link_url(link_elements[0], base_url)
-                                            item_data[sub_name] = link_url
-                                        else:
-                                            item_data[sub_name] = ''
-                                    
+                        for sub_name, field_name, matcher in compiled_sub_selectors:
+                            try:
+                                if matcher is None:
+                                    # Invalid selector, already reported above
+                                    item_data[sub_name] = ''
+                                
+                                # Handle special cases for images and links
+                                elif field_name in _IMAGE_FIELDS:
+                                    # Extract image URL
+                                    img_elements = matcher.select(element)
+                                    if img_elements:
+                                        img_url = self._extract_image_url(img_elements[0], base_url)
+                                        item_data[sub_name] = img_url
                                     else:
-                                        # Extract text content
-                                        sub_elements = element.select(sub_selector)
-                                        if sub_elements:
-                                            if len(sub_elements) == 1:
-                                                # Single element - extract as string
-                                                sub_content = self._extract_text_from_element(sub_elements[0])
-                                                item_data[sub_name] = sub_content
-                                            else:
-                                                # Multiple elements - extract as array
-                                                sub_contents = []
-                                                for sub_el in sub_elements:
-                                                    sub_content = self._extract_text_from_element(sub_el)
-                                                    if sub_content and sub_content not in sub_contents:
-                                                        sub_contents.append(sub_content)
-                                                item_data[sub_name] = sub_contents[0] if len(sub_contents) == 1 else sub_contents
-                                        else:
-                                            item_data[sub_name] = ''
+                                        item_data[sub_name] = ''
                                 
-                                except Exception as e:
-                                    logger.warning(f"Error extracting sub-selector '{sub_name}': {str(e)}")
-                                    item_data[sub_name] = ''
+                                elif field_name in _LINK_FIELDS:
+                                    # Extract link URL
+                                    link_elements = matcher.select(element)
+                                    if link_elements:
+                                        link_url = self._extract_link_url(link_elements[0], base_url)
+                                        item_data[sub_name] = link_url
+                                    else:
+                                        item_data[sub_name] = ''
+                                
+                                else:
+                                    # Extract text content
+                                    sub_elements = matcher.select(element)
+                                    if sub_elements:
+                                        if len(sub_elements) == 1:
+                                            # Single element - extract as string
+                                            sub_content = self._extract_text_from_element(sub_elements[0])
+                                            item_data[sub_name] = sub_content
+                                        else:
+                                            # Multiple elements - extract as array of unique texts, first occurrence wins
+                                            sub_contents = list(dict.fromkeys(
+                                                filter(None, map(self._extract_text_from_element, sub_elements))
+                                            ))
+                                            item_data[sub_name] = sub_contents[0] if len(sub_contents) == 1 else sub_contents
+                                    else:
+                                        item_data[sub_name] = ''
+                            
+                            except Exception as e:
+                                logger.warning(f"Error extracting sub-selector '{sub_name}': {str(e)}")
+                                item_data[sub_name] = ''
                         
                         # Add metadata
                         item_data['word_count'] = len(item_data['main_content'].split()) if item_data['main_content'] else 0
@@ -315,7 +329,8 @@ class ArrayContentExtractor:
                     
                     total_items += len(array_items)
                     
-                    logger.info(f"Selector '{selector_name}': {len(elements)} elements found, {len(array_items)} unique items (order preserved)")
+                    logger.info("Selector '%s': %d elements found, %d unique items (order preserved)",
+                                selector_name, len(elements), len(array_items))
                     
                 except Exception as e:
                     logger.error(f"Error processing selector '{selector_name}': {str(e)}")
@@ -396,7 +411,8 @@ class ArrayBasedCrawlerService:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.default_timeout = self.config.get('CRAWLER_TIMEOUT', 20)
-        self.extractor = ArrayContentExtractor()
+        self.max_batch_size = min(self.config.get('MAX_BATCH_SIZE', 3), 3)  # Array batches are capped at 3 URLs
+        self.extractor = ArrayContentExtractor(self.config.get('HTML_PARSER', 'html.parser'))
         
         # User agents for rotation
         self.user_agents = [
@@ -409,14 +425,38 @@ class ArrayBasedCrawlerService:
         """Random delay between requests"""
         return random.uniform(0.3, 0.8)
     
+    def _crawler_params(self) -> Dict[str, Any]:
+        """Crawler settings, with a randomly rotated user agent"""
+        return {
+            'verbose': False,
+            'headless': True,
+            'user_agent': random.choice(self.user_agents)
+        }
+    
+    async def _fetch(self, crawler: Any, url: str) -> Any:
+        """Fetch one page with an open crawler"""
+        return await asyncio.wait_for(
+            crawler.arun(
+                url=url,
+                word_count_threshold=1,
+                extraction_strategy=NoExtractionStrategy(),
+                bypass_cache=False,
+                delay_before_return_html=1.5
+            ),
+            timeout=self.default_timeout
+        )
+    
     async def crawl_array_content(self, url: str, 
                                 array_selectors: Dict[str, Any],
                                 exclude_selectors: Optional[List[str]] = None,
-                                format_output: str = 'structured') -> CrawlResult:
+                                format_output: str = 'structured',
+                                crawler: Optional[Any] = None) -> CrawlResult:
         """
         Crawl URL and extract content as arrays with proper ordering and image URLs
+        
+        An already open crawler can be passed in to reuse its browser; otherwise one is opened for this URL.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Validate URL
@@ -445,43 +485,33 @@ class ArrayBasedCrawlerService:
             # Add delay
             await asyncio.sleep(self.get_random_delay())
             
-            # Configure crawler
-            crawler_params = {
-                'verbose': False,
-                'headless': True,
-                'user_agent': random.choice(self.user_agents)
-            }
-            
             # Crawl the URL
             try:
-                async with AsyncWebCrawler(**crawler_params) as crawler:
-                    result = await asyncio.wait_for(
-                        crawler.arun(
-                            url=url,
-                            word_count_threshold=1,
-                            extraction_strategy=NoExtractionStrategy(),
-                            bypass_cache=False,
-                            delay_before_return_html=1.5
-                        ),
-                        timeout=self.default_timeout
-                    )
-                    
-                    return self._process_array_result(
-                        result, url, array_selectors, exclude_selectors, 
-                        format_output, time.time() - start_time
-                    )
+                if crawler is not None:
+                    result = await self._fetch(crawler, url)
+                else:
+                    async with AsyncWebCrawler(**self._crawler_params()) as crawler:
+                        result = await self._fetch(crawler, url)
+                
+                # Parsing and selector matching are CPU-bound; keep them off the event loop
+                return await asyncio.to_thread(
+                    self._process_array_result,
+                    result, url, array_selectors, exclude_selectors, 
+                    format_output, time.perf_counter() - start_time
+                )
                     
             except TypeError:
                 # Fallback for older API
-                crawler = AsyncWebCrawler(**crawler_params)
+                crawler = AsyncWebCrawler(**self._crawler_params())
                 result = await asyncio.wait_for(
                     crawler.arun(url=url) if hasattr(crawler, 'arun') else asyncio.to_thread(crawler.run, url),
                     timeout=self.default_timeout
                 )
                 
-                return self._process_array_result(
+                return await asyncio.to_thread(
+                    self._process_array_result,
                     result, url, array_selectors, exclude_selectors, 
-                    format_output, time.time() - start_time
+                    format_output, time.perf_counter() - start_time
                 )
                 
         except asyncio.TimeoutError:
@@ -506,7 +536,7 @@ class ArrayBasedCrawlerService:
         """Process crawl result for array extraction with proper ordering"""
         try:
             # Check if crawl was successful
-            if hasattr(result, 'success') and not result.success:
+            if not getattr(result, 'success', True):
                 return CrawlResult(
                     success=False,
                     url=url,
@@ -514,12 +544,10 @@ class ArrayBasedCrawlerService:
                 )
             
             # Get HTML content
-            html_content = ''
-            if hasattr(result, 'html'):
-                html_content = result.html
-            elif hasattr(result, 'cleaned_html'):
-                html_content = result.cleaned_html
-            else:
+            html_content = getattr(result, 'html', _MISSING)
+            if html_content is _MISSING:
+                html_content = getattr(result, 'cleaned_html', _MISSING)
+            if html_content is _MISSING:
                 return CrawlResult(
                     success=False,
                     url=url,
@@ -538,23 +566,25 @@ class ArrayBasedCrawlerService:
             content = self._format_array_output(arrays, format_output)
             
             # Extract title
-            title = ''
-            if hasattr(result, 'title'):
-                title = result.title
-            else:
+            title = getattr(result, 'title', _MISSING)
+            if title is _MISSING:
+                title = ''
                 try:
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = BeautifulSoup(html_content, self.extractor.parser)
                     title_tag = soup.find('title')
                     if title_tag:
                         title = title_tag.get_text().strip()
                 except:
                     title = ''
             
-            # Calculate total word count
-            total_words = sum(
-                sum(item.get('word_count', 0) for item in data.get('items', []))
-                for data in arrays.values()
-            )
+            # Calculate total word and item counts in one pass over the arrays
+            total_words = 0
+            total_items = 0
+            for data in arrays.values():
+                items = data.get('items')
+                if items:
+                    total_words += sum(item.get('word_count', 0) for item in items)
+                total_items += data.get('count', 0)
             
             # Prepare metadata
             metadata = {
@@ -567,7 +597,7 @@ class ArrayBasedCrawlerService:
                 'format_output': format_output,
                 'arrays': arrays,
                 'content_quality': {
-                    'total_items': sum(data['count'] for data in arrays.values()),
+                    'total_items': total_items,
                     'order_preserved': True,
                     'image_urls_absolute': True,
                     'link_urls_absolute': True
@@ -610,7 +640,7 @@ class ArrayBasedCrawlerService:
                         
                         # Add sub-selector data if available
                         for key, value in item.items():
-                            if key not in ['index', 'main_content', 'word_count', 'char_count']:
+                            if key not in _INTERNAL_ITEM_FIELDS:
                                 if isinstance(value, list):
                                     if value:
                                         item_text += f"\n{key}: {' | '.join(str(v) for v in value if v)}"
@@ -640,6 +670,10 @@ class ArrayBasedCrawlerService:
                 summary_parts.append(f"{selector_name}: {count} items found with selector '{selector}' (order preserved)")
             return "\n".join(summary_parts)
         
+        elif format_type == 'none':
+            # Caller only reads metadata['arrays'], so skip rendering a text copy
+            return ''
+        
         else:
             return self._format_array_output(arrays, 'structured')
     
@@ -648,33 +682,45 @@ class ArrayBasedCrawlerService:
                                          exclude_selectors: Optional[List[str]] = None,
                                          format_output: str = 'structured',
                                          max_concurrent: int = 2) -> List[CrawlResult]:
-        """Crawl multiple URLs for array content"""
+        """
+        Crawl multiple URLs for array content
+        
+        Always returns exactly one CrawlResult per URL, in the order of urls; failures are
+        reported as unsuccessful results rather than raised.
+        """
         max_concurrent = min(max_concurrent, 3)
         semaphore = asyncio.Semaphore(max_concurrent)
         
-        async def crawl_with_limit(url):
+        async def crawl_with_limit(url, crawler):
             async with semaphore:
                 return await self.crawl_array_content(
-                    url, array_selectors, exclude_selectors, format_output
+                    url, array_selectors, exclude_selectors, format_output, crawler
                 )
         
-        tasks = [crawl_with_limit(url) for url in urls]
+        async def crawl_all(crawler=None):
+            return await asyncio.gather(
+                *(crawl_with_limit(url, crawler) for url in urls), return_exceptions=True
+            )
         
         try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            processed_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    processed_results.append(CrawlResult(
-                        success=False,
-                        url=urls[i] if i < len(urls) else "unknown",
-                        error=f"Array content extraction failed: {str(result)}"
-                    ))
-                else:
-                    processed_results.append(result)
+            results = None
+            try:
+                # One browser for the whole batch, so its pages share the process and connection pool
+                async with AsyncWebCrawler(**self._crawler_params()) as crawler:
+                    results = await crawl_all(crawler)
+            except TypeError:
+                # Older API without async context support: every URL opens its own crawler
+                if results is None:
+                    results = await crawl_all()
             
-            return processed_results
+            return [
+                CrawlResult(
+                    success=False,
+                    url=url,
+                    error=f"Array content extraction failed: {str(result)}"
+                ) if isinstance(result, Exception) else result
+                for url, result in zip(urls, results)
+            ]
             
         except Exception as e:
             logger.error(f"Batch array content crawl error: {str(e)}")
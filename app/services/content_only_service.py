@@ -16,15 +16,28 @@ except ImportError:
     from crawl4ai.extraction_strategy import NoExtractionStrategy
 
 from app.utils.validators import validate_url
+from app.utils.selector_cache import compile_css
+from app.utils.html_parser import resolve_html_parser
 from app.models.crawler_models import CrawlResult, CrawlConfig
 
 logger = logging.getLogger(__name__)
 
+# Main content areas, in priority order
+_MAIN_CONTENT_SELECTORS = (
+    'main', 'article', '[role="main"]',
+    '.content', '.post-content', '.article-content',
+    '.entry-content', '.post-body', '.article-body',
+    '#content', '#main-content', '#article-content'
+)
+
 
 class ContentOnlyExtractor:
     """Extract clean text content from HTML without images, links, and unwanted elements"""
     
-    def __init__(self):
+    def __init__(self, parser: str = 'html.parser'):
+        # BeautifulSoup tree builder ('lxml' parses several times faster when installed)
+        self.parser = resolve_html_parser(parser)
+        
         # Tags to completely remove
         self.remove_tags = [
             'script', 'style', 'noscript', 'link', 'meta', 'title',
@@ -46,7 +59,7 @@ class ContentOnlyExtractor:
     def clean_html(self, html_content: str) -> str:
         """Clean HTML and extract only text content"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, self.parser)
             
             # Remove unwanted tags completely
             for tag in soup(self.remove_tags):
@@ -64,15 +77,8 @@ class ContentOnlyExtractor:
             
             # Find main content areas (prioritize)
             main_content = None
-            content_selectors = [
-                'main', 'article', '[role="main"]',
-                '.content', '.post-content', '.article-content',
-                '.entry-content', '.post-body', '.article-body',
-                '#content', '#main-content', '#article-content'
-            ]
-            
-            for selector in content_selectors:
-                main_content = soup.select_one(selector)
+            for selector in _MAIN_CONTENT_SELECTORS:
+                main_content = compile_css(selector).select_one(soup)
                 if main_content:
                     break
             
@@ -128,8 +134,8 @@ class ContentOnlyCrawlerService:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.default_timeout = self.config.get('CRAWLER_TIMEOUT', 15)
-        self.max_content_length = self.config.get('MAX_CONTENT_LENGTH', 10000)
-        self.extractor = ContentOnlyExtractor()
+        self.max_content_length = self.config.get('CRAWLER_MAX_CONTENT_LENGTH', 10000)
+        self.extractor = ContentOnlyExtractor(self.config.get('HTML_PARSER', 'html.parser'))
         
         # User agents for rotation
         self.user_agents = [
@@ -178,8 +184,11 @@ class ContentOnlyCrawlerService:
                         ),
                         timeout=self.default_timeout
                     )
-                    
-                    return self._process_content_result(result, url, max_length, time.time() - start_time)
+                
+                # HTML cleanup is CPU-bound; run it off the event loop so other crawls keep progressing
+                return await asyncio.to_thread(
+                    self._process_content_result, result, url, max_length, time.time() - start_time
+                )
                     
             except TypeError:
                 # Fallback for older API
@@ -189,7 +198,9 @@ class ContentOnlyCrawlerService:
                     timeout=self.default_timeout
                 )
                 
-                return self._process_content_result(result, url, max_length, time.time() - start_time)
+                return await asyncio.to_thread(
+                    self._process_content_result, result, url, max_length, time.time() - start_time
+                )
                 
         except asyncio.TimeoutError:
             return CrawlResult(
@@ -244,8 +255,7 @@ class ContentOnlyCrawlerService:
             else:
                 # Try to extract title from HTML
                 try:
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = BeautifulSoup(html_content, self.extractor.parser)
                     title_tag = soup.find('title')
                     if title_tag:
                         title = title_tag.get_text().strip()
@@ -281,7 +291,11 @@ class ContentOnlyCrawlerService:
             )
     
     async def crawl_multiple_content_only(self, urls: List[str], max_length: Optional[int] = None, max_concurrent: int = 3) -> List[CrawlResult]:
-        """Crawl multiple URLs for content-only extraction"""
+        """
+        Crawl multiple URLs for content-only extraction
+        
+        Always returns exactly one CrawlResult per URL, in the order of urls.
+        """
         max_concurrent = min(max_concurrent, 5)  # Safety limit
         semaphore = asyncio.Semaphore(max_concurrent)
         
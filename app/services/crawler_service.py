@@ -26,7 +26,7 @@ class SimpleCrawlerService:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.default_timeout = self.config.get('CRAWLER_TIMEOUT', 15)
-        self.max_content_length = self.config.get('MAX_CONTENT_LENGTH', 5000)
+        self.max_content_length = self.config.get('CRAWLER_MAX_CONTENT_LENGTH', 5000)
         
         # User agents for rotation
         self.user_agents = [
@@ -448,7 +448,7 @@ class EnhancedContentOnlyCrawlerService:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.default_timeout = self.config.get('CRAWLER_TIMEOUT', 15)
-        self.max_content_length = self.config.get('MAX_CONTENT_LENGTH', 10000)
+        self.max_content_length = self.config.get('CRAWLER_MAX_CONTENT_LENGTH', 10000)
         self.extractor = EnhancedContentExtractor()
         
         # User agents for rotation
@@ -0,0 +1,18 @@
+import hashlib
+import hmac
+import os
+from typing import Optional
+
+def _api_key_digest(api_key: str) -> bytes:
+    """Fixed-size digest of an API key for constant-time comparison"""
+    return hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+
+# Resolved once per process; the configured key never changes while the app is running
+_API_KEY = os.getenv('API_KEY', '')
+_VALID_KEY_DIGEST = _api_key_digest(_API_KEY) if _API_KEY else None
+
+def is_valid_api_key(api_key: Optional[str]) -> bool:
+    """Check a request's X-API-Key value against the configured API_KEY in constant time"""
+    if not api_key or _VALID_KEY_DIGEST is None:
+        return False
+    return hmac.compare_digest(_api_key_digest(api_key), _VALID_KEY_DIGEST)
@@ -0,0 +1,67 @@
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import os
+import threading
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_loop = None
+_loop_pid = None
+_lock = threading.Lock()
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the persistent background event loop, starting it on first use"""
+    global _loop, _loop_pid
+    # Threads do not survive fork, so a preloaded master's loop is not reused in workers
+    if _loop is None or _loop_pid != os.getpid():
+        with _lock:
+            if _loop is None or _loop_pid != os.getpid():
+                loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='async-runner', daemon=True).start()
+                atexit.register(loop.call_soon_threadsafe, loop.stop)
+                _loop, _loop_pid = loop, os.getpid()
+    return _loop
+
+def _copy_outcome(task: asyncio.Task, future: concurrent.futures.Future) -> None:
+    """Mirror a finished task onto the future the calling thread is waiting on"""
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+def run_async(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the background loop and wait for its result"""
+    loop = get_event_loop()
+    future = concurrent.futures.Future()
+    tasks = []
+    
+    def start():
+        # Runs in a copy of the caller's context, so the task sees Flask's app/request context
+        task = loop.create_task(coro)
+        task.add_done_callback(lambda t: _copy_outcome(t, future))
+        tasks.append(task)
+    
+    loop.call_soon_threadsafe(start, context=contextvars.copy_context())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        if future.done():
+            raise
+        loop.call_soon_threadsafe(lambda: tasks and tasks[0].cancel())
+        raise asyncio.TimeoutError(f"Coroutine did not finish within {timeout}s")
+
+def async_to_sync(func: Callable[..., Awaitable]) -> Callable[..., Any]:
+    """Wrap an async view so Flask can call it synchronously on the background loop"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return run_async(func(*args, **kwargs))
+    return wrapper
@@ -0,0 +1,11 @@
+import logging
+from bs4.builder import builder_registry
+
+logger = logging.getLogger(__name__)
+
+def resolve_html_parser(name: str) -> str:
+    """Return the requested BeautifulSoup parser, or html.parser when it is not installed"""
+    if builder_registry.lookup(name) is None:
+        logger.warning(f"HTML parser '{name}' is not available, falling back to html.parser")
+        return 'html.parser'
+    return name
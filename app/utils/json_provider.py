@@ -0,0 +1,59 @@
+from flask.json.provider import DefaultJSONProvider
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_static(obj: Any) -> bytes:
+    """Serialize a constant payload once, with the same key order as app.json responses"""
+    if orjson is None:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode()
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, falling back to the stdlib provider when it is missing"""
+
+    # Flask-compatible kwargs that map onto orjson options; anything else goes to json.dumps
+    _SUPPORTED_KWARGS = frozenset(('indent', 'separators', 'sort_keys'))
+
+    def _options(self, indent: Any = None, sort_keys: Any = None) -> int:
+        """Build the orjson option flags matching the provider settings"""
+        # Non-str keys and datetimes behave like Flask's default provider
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps_bytes(self, obj: Any, **kwargs: Any) -> bytes:
+        """Serialize data straight to UTF-8 JSON bytes"""
+        if orjson is None or not self._SUPPORTED_KWARGS.issuperset(kwargs):
+            return super().dumps(obj, **kwargs).encode()
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(kwargs.get('indent'), kwargs.get('sort_keys'))
+        )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string"""
+        if orjson is None or not self._SUPPORTED_KWARGS.issuperset(kwargs):
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, **kwargs).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON from a str or bytes"""
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Serialize arguments into a JSON response without an intermediate str"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = self.dumps_bytes(obj, indent=2) if indent else self.dumps_bytes(obj)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,13 @@
+from flask import request, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
+from typing import Any
+
+def read_json() -> Any:
+    """Parse the request body with app.json without caching the raw bytes (None when empty)"""
+    # Werkzeug rejects a Content-Length over MAX_CONTENT_LENGTH before reading anything,
+    # but silently stops a chunked body at the cap, so a chunked body that fills it is too large
+    raw = request.get_data(cache=False)
+    max_length = request.max_content_length
+    if request.content_length is None and max_length is not None and len(raw) >= max_length:
+        raise RequestEntityTooLarge()
+    return current_app.json.loads(raw) if raw else None
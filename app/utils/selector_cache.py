@@ -0,0 +1,7 @@
+from functools import lru_cache
+import soupsieve
+
+@lru_cache(maxsize=1024)
+def compile_css(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once so every page and request reuses it"""
+    return soupsieve.compile(selector)
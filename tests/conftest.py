@@ -0,0 +1,15 @@
+import pytest
+
+from app import create_app
+
+@pytest.fixture
+def app():
+    """Application built by the real factory, in testing mode"""
+    app = create_app('testing')
+    app.config['TESTING'] = True
+    return app
+
+@pytest.fixture
+def client(app):
+    """Test client for the app fixture"""
+    return app.test_client()
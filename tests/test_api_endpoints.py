@@ -0,0 +1,67 @@
+import pytest
+
+from app import create_app, extensions
+from app.extensions import limiter
+from app.utils import api_keys
+
+API_KEY = 'test-api-key'
+
+def _add_limited_route(app):
+    """Attach a view limited to 2 requests per minute, like the API views"""
+    @app.route('/_test/limited')
+    @limiter.limit("2 per minute")
+    def limited():
+        return {'ok': True}
+
+@pytest.fixture
+def limited_client(app):
+    _add_limited_route(app)
+    return app.test_client()
+
+@pytest.fixture
+def configured_api_key(monkeypatch):
+    """Configure API_KEY as if it had been set in the environment"""
+    monkeypatch.setattr(api_keys, '_VALID_KEY_DIGEST', api_keys._api_key_digest(API_KEY))
+
+# --- rate limiting ---
+
+def test_rate_limit_exceeded_returns_json_429(limited_client):
+    statuses = [limited_client.get('/_test/limited').status_code for _ in range(2)]
+    response = limited_client.get('/_test/limited')
+
+    assert statuses == [200, 200]
+    assert response.status_code == 429
+    assert response.mimetype == 'application/json'
+    assert response.get_json() == {
+        'success': False,
+        'error': 'Rate limit exceeded',
+        'message': 'Too many requests. Please try again later or use an API key for unlimited access.',
+        'details': {
+            'retry_after_seconds': 60,
+            'api_key_header': 'X-API-Key',
+            'documentation': '/api/v1/docs'
+        }
+    }
+
+def test_valid_api_key_is_not_rate_limited(limited_client, configured_api_key):
+    headers = {'X-API-Key': API_KEY}
+    statuses = {limited_client.get('/_test/limited', headers=headers).status_code for _ in range(5)}
+
+    assert statuses == {200}
+
+def test_invalid_api_key_is_rate_limited(limited_client, configured_api_key):
+    headers = {'X-API-Key': 'wrong-key'}
+    statuses = [limited_client.get('/_test/limited', headers=headers).status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+
+def test_development_is_not_rate_limited(monkeypatch):
+    monkeypatch.setattr(extensions, 'IS_DEVELOPMENT', True)
+    app = create_app('testing')
+    _add_limited_route(app)
+    client = app.test_client()
+
+    statuses = {client.get('/_test/limited').status_code for _ in range(5)}
+
+    assert app.config['RATELIMIT_ENABLED'] is False
+    assert statuses == {200}
@@ -0,0 +1,169 @@
+import asyncio
+import threading
+
+import pytest
+from flask import current_app, request
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.test import EnvironBuilder
+
+from app.utils import json_provider
+from app.utils.async_runner import run_async
+from app.utils.json_provider import ORJSONProvider, dumps_static
+from app.utils.request_helpers import read_json
+
+class ViewError(Exception):
+    """Raised by test views to check exception propagation"""
+
+# --- async_runner ---
+
+def test_run_async_returns_result():
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert run_async(add(2, 3)) == 5
+
+def test_run_async_propagates_exception():
+    async def fail():
+        await asyncio.sleep(0)
+        raise ViewError("boom")
+
+    with pytest.raises(ViewError, match="boom"):
+        run_async(fail())
+
+def test_run_async_timeout_cancels_task():
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(asyncio.TimeoutError):
+        run_async(slow(), timeout=0.05)
+    assert cancelled.wait(1), "timed out coroutine was not cancelled"
+
+def test_async_view_sees_request_and_app_context(app, client):
+    @app.route('/_test/async-context', methods=['POST'])
+    async def async_context():
+        await asyncio.sleep(0)
+        return {'path': request.path, 'body': request.get_json(), 'app': current_app.name}
+
+    response = client.post('/_test/async-context', json={'x': 1})
+
+    assert response.status_code == 200
+    assert response.get_json() == {'path': '/_test/async-context', 'body': {'x': 1}, 'app': app.name}
+
+def test_async_view_propagates_exception(app, client):
+    @app.route('/_test/async-error')
+    async def async_error():
+        await asyncio.sleep(0)
+        raise ViewError("view failed")
+
+    with pytest.raises(ViewError, match="view failed"):
+        client.get('/_test/async-error')
+
+# --- request_helpers.read_json ---
+
+def test_read_json_parses_body(app):
+    with app.test_request_context(method='POST', data=b'{"url": "https://example.com"}',
+                                  content_type='application/json'):
+        assert read_json() == {'url': 'https://example.com'}
+
+def test_read_json_empty_body_returns_none(app):
+    with app.test_request_context(method='POST'):
+        assert read_json() is None
+
+def test_read_json_invalid_json_raises_value_error(app):
+    # Views answer ValueError with a 400 "Invalid JSON" response
+    with app.test_request_context(method='POST', data=b'{bad', content_type='application/json'):
+        with pytest.raises(ValueError):
+            read_json()
+
+def test_read_json_oversized_body_raises_413(app):
+    app.config['MAX_CONTENT_LENGTH'] = 16
+    body = b'{"url": "https://example.com/long"}'
+    with app.test_request_context(method='POST', data=body, content_type='application/json'):
+        with pytest.raises(RequestEntityTooLarge) as exc_info:
+            read_json()
+    assert exc_info.value.code == 413
+
+def test_read_json_body_at_limit_is_accepted(app):
+    body = b'{"a": 1}'
+    app.config['MAX_CONTENT_LENGTH'] = len(body)
+    with app.test_request_context(method='POST', data=body, content_type='application/json'):
+        assert read_json() == {'a': 1}
+
+def _chunked_environ(body):
+    """WSGI environ for a body sent without Content-Length (chunked transfer)"""
+    environ = EnvironBuilder(method='POST', data=body, content_type='application/json').get_environ()
+    del environ['CONTENT_LENGTH']
+    environ['wsgi.input_terminated'] = True
+    return environ
+
+def test_read_json_oversized_chunked_body_raises_413(app):
+    # Werkzeug cuts a chunked body off at the cap instead of raising
+    app.config['MAX_CONTENT_LENGTH'] = 16
+    with app.request_context(_chunked_environ(b'{"url": "https://example.com/long"}')):
+        with pytest.raises(RequestEntityTooLarge):
+            read_json()
+
+def test_read_json_small_chunked_body_is_accepted(app):
+    app.config['MAX_CONTENT_LENGTH'] = 16
+    with app.request_context(_chunked_environ(b'{"a": 1}')):
+        assert read_json() == {'a': 1}
+
+# --- json_provider ---
+
+PAYLOAD = {'b': [1, 2.5, None], 'a': {'z': True, 'y': 'text'}, 'c': 'ünïcode'}
+
+@pytest.fixture
+def no_orjson(monkeypatch):
+    """Force the stdlib fallback path"""
+    monkeypatch.setattr(json_provider, 'orjson', None)
+
+def test_app_uses_orjson_provider(app):
+    assert isinstance(app.json, ORJSONProvider)
+
+@pytest.mark.skipif(json_provider.orjson is None, reason="orjson is not installed")
+def test_provider_orjson_round_trip(app):
+    dumped = app.json.dumps(PAYLOAD)
+
+    assert app.json.loads(dumped) == PAYLOAD
+    assert app.json.loads(dumped.encode()) == PAYLOAD
+
+def test_provider_stdlib_fallback_round_trip(app, no_orjson):
+    dumped = app.json.dumps(PAYLOAD)
+
+    assert isinstance(dumped, str)
+    assert app.json.loads(dumped) == PAYLOAD
+
+def test_provider_loads_invalid_json_raises_value_error(app):
+    with pytest.raises(ValueError):
+        app.json.loads('{bad')
+
+def test_provider_loads_invalid_json_fallback_raises_value_error(app, no_orjson):
+    with pytest.raises(ValueError):
+        app.json.loads('{bad')
+
+def test_provider_response_matches_fallback(app, monkeypatch):
+    with app.app_context():
+        body = app.json.response(PAYLOAD).get_data()
+        monkeypatch.setattr(json_provider, 'orjson', None)
+        fallback_body = app.json.response(PAYLOAD).get_data()
+
+    assert app.json.loads(body) == app.json.loads(fallback_body) == PAYLOAD
+    assert body.endswith(b"\n")
+
+def test_dumps_static_sorts_keys():
+    assert dumps_static(PAYLOAD).startswith(b'{"a":{"y":"text","z":true}')
+
+def test_dumps_static_matches_stdlib_fallback(monkeypatch):
+    # Static bodies are ASCII, so both paths must produce identical bytes
+    payload = {'success': False, 'error': 'Rate limit exceeded', 'details': {'retry_after_seconds': 60}}
+    body = dumps_static(payload)
+    monkeypatch.setattr(json_provider, 'orjson', None)
+
+    assert dumps_static(payload) == body